@@ -14,6 +14,8 @@ setup(
         "typing-extensions>=4.7.1",
         "flask>=2.3.2",
         "flask-socketio>=5.3.4",
+        "eventlet>=0.33.3",
+        "orjson>=3.9.5",
         "redis>=4.6.0",
     ],
     extras_require={
@@ -27,12 +29,16 @@ setup(
             "mypy>=1.5.1",
             "pre-commit>=3.3.3",
             "debugpy>=1.6.7",
-        ]
+        ],
+        "speedups": [
+            "numba>=0.58",
+            "numpy>=1.24.0",
+        ],
     },
     entry_points={
         "console_scripts": [
             "mahjong-engine=main:main",
-            "mahjong-web=web_server:main",
+            "mahjong-web=web_launcher:main",
         ],
     },
     classifiers=[
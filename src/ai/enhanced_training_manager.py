@@ -27,6 +27,18 @@ class EnhancedTrainingManager:
         self.logger = TrainingLogger(log_dir="logs", experiment_name=experiment_name)
         self.analyzer = PerformanceAnalyzer()
 
+        # Per-action reward functions for calculate_enhanced_reward
+        self._reward_fns = {
+            "tsumo": self._win_reward,
+            "ron": self._win_reward,
+            "riichi": self._riichi_reward,
+            "discard": self._discard_reward,
+            "chii": self._call_reward,
+            "pon": self._call_reward,
+            "kan": self._call_reward,
+            "pass": self._pass_reward,
+        }
+
         # Save configuration
         config_path = os.path.join(save_dir, "training_config.json")
         config.save(config_path)
@@ -189,11 +201,13 @@ class EnhancedTrainingManager:
             # Handle reactions to discard/riichi in proper player order.
             if action in ["discard", "riichi"] and game.last_discard is not None:
                 call_was_made = False
+                # Passing leaves the public state untouched and any successful
+                # call ends the loop, so one snapshot serves every responder.
+                responder_state = game.get_game_state()
 
                 for offset in range(1, 4):
                     responder_idx = (current_player_idx + offset) % 4
                     responder = players[responder_idx]
-                    responder_state = game.get_game_state()
                     responder_hand = game.get_player_hand(responder_idx)
                     responder_actions = game.get_valid_actions(responder_idx)
 
@@ -291,58 +305,60 @@ class EnhancedTrainingManager:
         game_state: Dict[str, Any],
     ) -> float:
         """Calculate enhanced reward based on game context with progress incentives"""
+        reward_fn = self._reward_fns.get(action, self._default_reward)
+        return reward_fn(player_hand)
 
+    def _win_reward(self, player_hand: Dict[str, Any]) -> float:
         # Winning actions get maximum reward
-        if action == "tsumo" or action == "ron":
-            return self.config.win_reward
-
-        elif action == "riichi":
-            # Bonus for riichi based on hand quality
-            winning_tiles = len(player_hand.get("winning_tiles", []))
-            riichi_bonus = winning_tiles * 0.5  # More waits = better riichi
-            return self.config.riichi_reward + riichi_bonus
-
-        elif action == "discard":
-            # Get hand analysis
-            is_tenpai = player_hand.get("is_tenpai", False)
-            winning_tiles = len(player_hand.get("winning_tiles", []))
-            concealed_tiles = len(player_hand.get("concealed_tiles", []))
-
-            # Reward structure based on hand progress
-            if is_tenpai:
-                # Strong reward for maintaining tenpai
-                tenpai_bonus = winning_tiles * 0.3  # More waits = better
-                return self.config.tenpai_reward + tenpai_bonus
-
-            elif winning_tiles > 0:
-                # Reward for being close to tenpai (1-shanten, 2-shanten, etc.)
-                # More winning tiles = closer to tenpai = better reward
-                progress_reward = self.config.base_reward * (1 + winning_tiles * 0.2)
-                return progress_reward
+        return self.config.win_reward
+
+    def _riichi_reward(self, player_hand: Dict[str, Any]) -> float:
+        # Bonus for riichi based on hand quality
+        winning_tiles = len(player_hand.get("winning_tiles", []))
+        riichi_bonus = winning_tiles * 0.5  # More waits = better riichi
+        return self.config.riichi_reward + riichi_bonus
+
+    def _discard_reward(self, player_hand: Dict[str, Any]) -> float:
+        # Get hand analysis
+        is_tenpai = player_hand.get("is_tenpai", False)
+        winning_tiles = len(player_hand.get("winning_tiles", []))
+
+        # Reward structure based on hand progress
+        if is_tenpai:
+            # Strong reward for maintaining tenpai
+            tenpai_bonus = winning_tiles * 0.3  # More waits = better
+            return self.config.tenpai_reward + tenpai_bonus
+
+        elif winning_tiles > 0:
+            # Reward for being close to tenpai (1-shanten, 2-shanten, etc.)
+            # More winning tiles = closer to tenpai = better reward
+            progress_reward = self.config.base_reward * (1 + winning_tiles * 0.2)
+            return progress_reward
 
-            else:
-                # Small penalty for having no clear path to winning
-                # Encourage players to work toward tenpai
-                stagnation_penalty = self.config.base_reward * 0.3
-                return -stagnation_penalty
-
-        elif action in ["chii", "pon", "kan"]:
-            # Analyze if the call improves the hand
-            winning_tiles = len(player_hand.get("winning_tiles", []))
-
-            if winning_tiles > 0:
-                # Good call that maintains winning potential
-                call_bonus = self.config.base_reward * (2 + winning_tiles * 0.1)
-                return call_bonus
-            else:
-                # Call that doesn't help winning - small penalty
-                return self.config.base_reward * 0.5
+        else:
+            # Small penalty for having no clear path to winning
+            # Encourage players to work toward tenpai
+            stagnation_penalty = self.config.base_reward * 0.3
+            return -stagnation_penalty
+
+    def _call_reward(self, player_hand: Dict[str, Any]) -> float:
+        # Analyze if the call improves the hand
+        winning_tiles = len(player_hand.get("winning_tiles", []))
+
+        if winning_tiles > 0:
+            # Good call that maintains winning potential
+            call_bonus = self.config.base_reward * (2 + winning_tiles * 0.1)
+            return call_bonus
+        else:
+            # Call that doesn't help winning - small penalty
+            return self.config.base_reward * 0.5
 
-        elif action == "pass":
-            # Small reward for passing when appropriate
-            # (avoiding bad calls is good strategy)
-            return self.config.base_reward * 0.1
+    def _pass_reward(self, player_hand: Dict[str, Any]) -> float:
+        # Small reward for passing when appropriate
+        # (avoiding bad calls is good strategy)
+        return self.config.base_reward * 0.1
 
+    def _default_reward(self, player_hand: Dict[str, Any]) -> float:
         # Default small reward for valid actions
         return self.config.base_reward * 0.5
 
@@ -410,11 +426,10 @@ class EnhancedTrainingManager:
 
     def _calculate_position(self, player_score: int, all_scores: List[int]) -> int:
         """Calculate player's final position (1st, 2nd, 3rd, 4th)"""
-        sorted_scores = sorted(all_scores, reverse=True)
-        try:
-            return sorted_scores.index(player_score) + 1
-        except ValueError:
+        if player_score not in all_scores:
             return 4  # Default to last place if not found
+        # Ties share the better position, as with the first match in a sort
+        return 1 + sum(score > player_score for score in all_scores)
 
     # Additional method to track and reward progress during game
     def give_progress_reward(
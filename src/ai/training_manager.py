@@ -9,6 +9,8 @@ from ai.neural_player import NeuralPlayer
 from game.engine import MahjongEngine
 from tiles.tile import Wind
 
+MAX_TURNS_PER_GAME = 200  # Prevent infinite games
+
 
 class TrainingManager:
     """Manages the training process for neural network players"""
@@ -94,7 +96,7 @@ class TrainingManager:
         self, game: MahjongEngine, players: List[NeuralPlayer]
     ) -> Dict[str, Any]:
         """Play a single training game"""
-        max_turns = 200  # Prevent infinite games
+        max_turns = MAX_TURNS_PER_GAME
         turn_count = 0
         result: Dict[str, Any] = {"winner": -1}
 
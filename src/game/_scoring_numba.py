@@ -0,0 +1,169 @@
+"""Optional Numba kernel for the count-vector meld search.
+
+Install numba (``pip install riichi-mahjong[speedups]``) to enable it; without
+it ``NUMBA_AVAILABLE`` is False and game.decomposition uses its pure-Python
+search.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    np = None
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Capacity of the result buffer; a full buffer means the caller must fall
+# back to the unbounded Python search.
+MAX_DECOMPOSITIONS = 16
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, nogil=True)
+    def _first_nonzero(counts, start):
+        i = start
+        while i < 34 and counts[i] == 0:
+            i += 1
+        return i
+
+    @njit(cache=True, nogil=True)
+    def extract_melds(counts, out, allow_triplets):
+        """Write every meld split of ``counts`` into ``out``.
+
+        ``counts`` is an int8[34] vector, modified during the search and
+        restored on return. ``out`` is int8[n, max_melds, 2]; row ``k`` holds
+        ``(kind, index)`` pairs (0 = triplet, 1 = sequence). Only sequences
+        are tried when ``allow_triplets`` is False. Returns the number of
+        rows written.
+        """
+        max_melds = out.shape[1]
+        index = np.empty(max_melds + 1, np.int64)
+        kind = np.empty(max_melds + 1, np.int8)
+        choice = np.zeros(max_melds + 1, np.int8)
+        written = 0
+        depth = 0
+        index[0] = _first_nonzero(counts, 0)
+
+        while depth >= 0:
+            i = index[depth]
+            if i == 34 or choice[depth] == 2:
+                if i == 34 and written < out.shape[0]:
+                    for k in range(depth):
+                        out[written, k, 0] = kind[k]
+                        out[written, k, 1] = index[k]
+                    written += 1
+                depth -= 1
+                if depth >= 0:
+                    # Undo the meld taken at this level before trying the next.
+                    j = index[depth]
+                    if kind[depth] == 0:
+                        counts[j] += 3
+                    else:
+                        counts[j] += 1
+                        counts[j + 1] += 1
+                        counts[j + 2] += 1
+                continue
+
+            if choice[depth] == 0:
+                choice[depth] = 1
+                if allow_triplets and counts[i] >= 3 and depth < max_melds:
+                    counts[i] -= 3
+                    kind[depth] = 0
+                    depth += 1
+                    choice[depth] = 0
+                    index[depth] = _first_nonzero(counts, i)
+                continue
+
+            choice[depth] = 2
+            if (
+                i < 27
+                and i % 9 <= 6
+                and counts[i + 1] > 0
+                and counts[i + 2] > 0
+                and depth < max_melds
+            ):
+                counts[i] -= 1
+                counts[i + 1] -= 1
+                counts[i + 2] -= 1
+                kind[depth] = 1
+                depth += 1
+                choice[depth] = 0
+                index[depth] = _first_nonzero(counts, i)
+
+        return written
+
+    @njit(cache=True, nogil=True)
+    def _undo_meld(counts, kind, i):
+        if kind == 0:
+            counts[i] += 3
+        else:
+            counts[i] += 1
+            counts[i + 1] += 1
+            counts[i + 2] += 1
+
+    @njit(cache=True, nogil=True)
+    def _has_melds(counts):
+        # Same depth-first search as extract_melds, stopping at the first
+        # full split. It keeps an explicit stack because recursive functions
+        # crash when Numba loads them back from its on-disk cache.
+        max_melds = 0
+        for c in counts:
+            max_melds += c
+        max_melds //= 3
+        index = np.empty(max_melds + 1, np.int64)
+        kind = np.empty(max_melds + 1, np.int8)
+        choice = np.zeros(max_melds + 1, np.int8)
+        depth = 0
+        index[0] = _first_nonzero(counts, 0)
+
+        while depth >= 0:
+            i = index[depth]
+            if i == 34:
+                for k in range(depth):
+                    _undo_meld(counts, kind[k], index[k])
+                return True
+            if choice[depth] == 2:
+                depth -= 1
+                if depth >= 0:
+                    _undo_meld(counts, kind[depth], index[depth])
+                continue
+
+            if choice[depth] == 0:
+                choice[depth] = 1
+                if counts[i] >= 3:
+                    counts[i] -= 3
+                    kind[depth] = 0
+                    depth += 1
+                    choice[depth] = 0
+                    index[depth] = _first_nonzero(counts, i)
+                continue
+
+            choice[depth] = 2
+            if i < 27 and i % 9 <= 6 and counts[i + 1] > 0 and counts[i + 2] > 0:
+                counts[i] -= 1
+                counts[i + 1] -= 1
+                counts[i + 2] -= 1
+                kind[depth] = 1
+                depth += 1
+                choice[depth] = 0
+                index[depth] = _first_nonzero(counts, i)
+
+        return False
+
+    @njit(cache=True, nogil=True)
+    def is_standard_hand(counts):
+        """Whether the int8[34] ``counts`` split into melds plus one pair."""
+        for pair in range(34):
+            if counts[pair] >= 2:
+                counts[pair] -= 2
+                found = _has_melds(counts)
+                counts[pair] += 2
+                if found:
+                    return True
+        return False
+
+else:
+    extract_melds = None
+    is_standard_hand = None
@@ -0,0 +1,196 @@
+"""Standard hand decomposition over 34-entry tile count vectors.
+
+Tiles are identified by ``Tile.index`` (0-33) and a hand is a ``bytearray``
+of per-kind counts. Melds are encoded as ``(kind, index)`` pairs where
+``index`` is the lowest tile of the meld, so the search never allocates or
+sorts ``Tile`` objects; callers convert back with ``meld_tiles``.
+
+Sets of tile kinds are ``int`` masks where bit i stands for kind i; the
+``*_MASK`` constants cover the common groups.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from game import _scoring_numba as _numba
+from tiles.tile import TILE_KINDS, Suit, Tile, Wind
+from utils.cache import BoundedCache
+
+TRIPLET = 0
+SEQUENCE = 1
+
+MeldCode = Tuple[int, int]
+
+MANZU_MASK = 0x1FF
+PINZU_MASK = 0x1FF << 9
+SOUZU_MASK = 0x1FF << 18
+SUIT_MASKS = (MANZU_MASK, PINZU_MASK, SOUZU_MASK)
+HONOR_MASK = 0x7F << 27
+DRAGON_MASK = 0x7 << 31
+TERMINAL_MASK = 0x101 | (0x101 << 9) | (0x101 << 18)
+TERMINAL_HONOR_MASK = TERMINAL_MASK | HONOR_MASK
+WIND_BITS = {wind: 1 << Tile(Suit.WIND, wind=wind).index for wind in Wind}
+
+# standard_decompositions results keyed by tile counts and search mode, so
+# the yaku and fu checks of one win share a single search.
+_decompositions_cache: BoundedCache[
+    Tuple[bytes, bool], Tuple[Tuple[Tuple[MeldCode, ...], int], ...]
+] = BoundedCache()
+
+
+def tile_counts(tiles: Iterable[Tile]) -> bytearray:
+    """Count tiles per kind."""
+    counts = bytearray(34)
+    for tile in tiles:
+        counts[tile.index] += 1
+    return counts
+
+
+def tile_mask(tiles: Iterable[Tile]) -> int:
+    """Mask of the tile kinds present."""
+    mask = 0
+    for tile in tiles:
+        mask |= 1 << tile.index
+    return mask
+
+
+def extract_melds(
+    counts: bytearray, allow_triplets: bool = True
+) -> List[List[MeldCode]]:
+    """Enumerate every way to split ``counts`` entirely into melds.
+
+    ``counts`` is modified during the search and restored before returning.
+    """
+    if _numba.NUMBA_AVAILABLE:
+        compiled = _extract_melds_numba(counts, allow_triplets)
+        if compiled is not None:
+            return compiled
+
+    results: List[List[MeldCode]] = []
+    _extract(counts, 0, [], results, allow_triplets)
+    return results
+
+
+def _extract_melds_numba(
+    counts: bytearray, allow_triplets: bool
+) -> Optional[List[List[MeldCode]]]:
+    np = _numba.np
+    out = np.zeros((_numba.MAX_DECOMPOSITIONS, sum(counts) // 3, 2), dtype=np.int8)
+    written = _numba.extract_melds(
+        np.frombuffer(counts, dtype=np.int8).copy(), out, allow_triplets
+    )
+    if written == _numba.MAX_DECOMPOSITIONS:
+        return None  # buffer may have been truncated
+    return [[(int(kind), int(index)) for kind, index in row] for row in out[:written]]
+
+
+def _extract(
+    counts: bytearray,
+    start: int,
+    melds: List[MeldCode],
+    results: List[List[MeldCode]],
+    allow_triplets: bool,
+) -> None:
+    i = start
+    while i < 34 and not counts[i]:
+        i += 1
+    if i == 34:
+        results.append(melds[:])
+        return
+
+    if allow_triplets and counts[i] >= 3:
+        counts[i] -= 3
+        melds.append((TRIPLET, i))
+        _extract(counts, i, melds, results, allow_triplets)
+        melds.pop()
+        counts[i] += 3
+
+    if i < 27 and i % 9 <= 6 and counts[i + 1] and counts[i + 2]:
+        counts[i] -= 1
+        counts[i + 1] -= 1
+        counts[i + 2] -= 1
+        melds.append((SEQUENCE, i))
+        _extract(counts, i, melds, results, allow_triplets)
+        melds.pop()
+        counts[i] += 1
+        counts[i + 1] += 1
+        counts[i + 2] += 1
+
+
+def is_standard_hand(counts: bytearray) -> bool:
+    """Whether a hand with 3n+2 tiles splits into n melds and a pair.
+
+    Stops at the first split found, so it is cheaper than
+    ``standard_decompositions`` when only completeness matters.
+    """
+    if _numba.NUMBA_AVAILABLE:
+        np = _numba.np
+        return bool(
+            _numba.is_standard_hand(np.frombuffer(counts, dtype=np.int8).copy())
+        )
+
+    for pair in range(34):
+        if counts[pair] < 2:
+            continue
+        counts[pair] -= 2
+        found = _has_melds(counts, 0)
+        counts[pair] += 2
+        if found:
+            return True
+    return False
+
+
+def _has_melds(counts: bytearray, start: int) -> bool:
+    i = start
+    while i < 34 and not counts[i]:
+        i += 1
+    if i == 34:
+        return True
+
+    if counts[i] >= 3:
+        counts[i] -= 3
+        found = _has_melds(counts, i)
+        counts[i] += 3
+        if found:
+            return True
+
+    if i < 27 and i % 9 <= 6 and counts[i + 1] and counts[i + 2]:
+        counts[i] -= 1
+        counts[i + 1] -= 1
+        counts[i + 2] -= 1
+        found = _has_melds(counts, i)
+        counts[i] += 1
+        counts[i + 1] += 1
+        counts[i + 2] += 1
+        if found:
+            return True
+
+    return False
+
+
+def standard_decompositions(
+    counts: bytearray, allow_triplets: bool = True
+) -> List[Tuple[List[MeldCode], int]]:
+    """Enumerate (melds, pair index) splits of a hand with 3n+2 tiles."""
+    key = (bytes(counts), allow_triplets)
+    cached = _decompositions_cache.get(key)
+    if cached is None:
+        found = []
+        for pair in range(34):
+            if counts[pair] < 2:
+                continue
+            counts[pair] -= 2
+            for melds in extract_melds(counts, allow_triplets):
+                found.append((tuple(melds), pair))
+            counts[pair] += 2
+        cached = tuple(found)
+        _decompositions_cache.put(key, cached)
+    return [(list(melds), pair) for melds, pair in cached]
+
+
+def meld_tiles(meld: MeldCode) -> List[Tile]:
+    """Convert an encoded meld back to its (ascending) tiles."""
+    kind, index = meld
+    if kind == TRIPLET:
+        tile = TILE_KINDS[index]
+        return [tile, tile, tile]
+    return [TILE_KINDS[index], TILE_KINDS[index + 1], TILE_KINDS[index + 2]]
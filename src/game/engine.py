@@ -242,7 +242,6 @@ class MahjongEngine:
     ) -> Dict[str, bool]:
         """Build situational yaku context flags for the current win check."""
         player = self.players[player_index]
-        no_discards_yet = all(len(p.hand.discards) == 0 for p in self.players)
         last_tile = self.wall.tiles_remaining() == 0
 
         return {
@@ -256,8 +255,9 @@ class MahjongEngine:
                 is_tsumo
                 and player.is_dealer
                 and self.turn_number == 0
-                and no_discards_yet
                 and not self.has_open_call
+                # Scanned last: only a dealer's first-turn tsumo gets here
+                and all(not p.hand.discards for p in self.players)
             ),
             "is_chiihou": (
                 is_tsumo
@@ -298,37 +298,9 @@ class MahjongEngine:
         result = {"success": False, "message": "", "game_ended": False}
 
         try:
-            if action == "discard":
-                tile_str = kwargs.get("tile")
-                result = self._execute_discard(player_index, tile_str)
-
-            elif action == "tsumo":
-                result = self._execute_tsumo(player_index)
-
-            elif action == "ron":
-                result = self._execute_ron(player_index)
-
-            elif action == "riichi":
-                tile_str = kwargs.get("tile")
-                result = self._execute_riichi(player_index, tile_str)
-
-            elif action == "chii":
-                sequence = kwargs.get("sequence", [])
-                result = self._execute_chii(player_index, sequence)
-
-            elif action == "pon":
-                result = self._execute_pon(player_index)
-
-            elif action == "kan":
-                tile_str = kwargs.get("tile")
-                if self.last_discard:
-                    result = self._execute_kan(player_index)
-                else:
-                    result = self._execute_closed_or_added_kan(player_index, tile_str)
-
-            elif action == "pass":
-                result = self._execute_pass(player_index)
-
+            handler = self._ACTION_HANDLERS.get(action)
+            if handler is not None:
+                result = handler(self, player_index, kwargs)
             else:
                 result["message"] = f"Unknown action: {action}"
 
@@ -341,6 +313,51 @@ class MahjongEngine:
 
         return result
 
+    def _discard_action(
+        self, player_index: int, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self._execute_discard(player_index, kwargs.get("tile"))
+
+    def _tsumo_action(
+        self, player_index: int, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self._execute_tsumo(player_index)
+
+    def _ron_action(self, player_index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return self._execute_ron(player_index)
+
+    def _riichi_action(
+        self, player_index: int, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self._execute_riichi(player_index, kwargs.get("tile"))
+
+    def _chii_action(self, player_index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return self._execute_chii(player_index, kwargs.get("sequence", []))
+
+    def _pon_action(self, player_index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return self._execute_pon(player_index)
+
+    def _kan_action(self, player_index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.last_discard:
+            return self._execute_kan(player_index)
+        return self._execute_closed_or_added_kan(player_index, kwargs.get("tile"))
+
+    def _pass_action(self, player_index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return self._execute_pass(player_index)
+
+    # Shared by all engines; plain functions avoid a per-engine table of
+    # bound methods (and the reference cycle it would create).
+    _ACTION_HANDLERS = {
+        "discard": _discard_action,
+        "tsumo": _tsumo_action,
+        "ron": _ron_action,
+        "riichi": _riichi_action,
+        "chii": _chii_action,
+        "pon": _pon_action,
+        "kan": _kan_action,
+        "pass": _pass_action,
+    }
+
     def _execute_discard(self, player_index: int, tile_str: str) -> Dict[str, Any]:
         """Execute discard action"""
         if player_index != self.current_player:
@@ -884,20 +901,22 @@ class MahjongEngine:
 
     def get_safe_tiles_for_player(self, player_index: int) -> List[str]:
         """Get tiles that are safe to discard for a player"""
-        player = self.players[player_index]
-        safe_tiles = set()
+        held = set(self.players[player_index].hand.concealed_tiles)
 
-        # Tiles already discarded by all players are generally safe
-        for p in self.players:
-            safe_tiles.update(p.hand.discards)
+        # Held tiles already discarded by any player are generally safe
+        safe_tiles = {
+            tile for p in self.players for tile in p.hand.discards if tile in held
+        }
 
-        # Remove tiles that could be winning tiles for tenpai players
+        # Remove tiles that could be winning tiles for tenpai players; the
+        # wait searches are skipped once nothing is left to remove.
         for i, p in enumerate(self.players):
+            if not safe_tiles:
+                break
             if i != player_index and p.is_tenpai():
-                winning_tiles = p.hand.get_winning_tiles()
-                safe_tiles -= set(winning_tiles)
+                safe_tiles.difference_update(p.hand.get_winning_tiles())
 
-        return [str(tile) for tile in safe_tiles if tile in player.hand.concealed_tiles]
+        return [str(tile) for tile in safe_tiles]
 
     def get_dangerous_tiles_for_player(self, player_index: int) -> List[str]:
         """Get tiles that are dangerous to discard"""
@@ -909,11 +928,8 @@ class MahjongEngine:
                 dangerous_tiles.update(player.hand.get_winning_tiles())
 
         current_player = self.players[player_index]
-        return [
-            str(tile)
-            for tile in dangerous_tiles
-            if tile in current_player.hand.concealed_tiles
-        ]
+        held = set(current_player.hand.concealed_tiles)
+        return [str(tile) for tile in dangerous_tiles if tile in held]
 
     def can_call_closed_kan(self, player_index: int) -> List[str]:
         """Get tiles that can be used for closed kan"""
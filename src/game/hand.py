@@ -1,7 +1,46 @@
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Set, Tuple
 
-from tiles.tile import Suit, Tile
+from game.decomposition import is_standard_hand, tile_counts
+from tiles.tile import TILE_KINDS, Tile
+from utils.cache import BoundedCache
+
+# Count-vector indices of the thirteen terminal and honor kinds
+_KOKUSHI_INDICES = tuple(
+    tile.index for tile in TILE_KINDS if tile.is_terminal() or tile.is_honor()
+)
+_KOKUSHI_BITS = sum(1 << i for i in _KOKUSHI_INDICES)
+
+
+def _reach_bits(index: int) -> int:
+    """Kinds that can share a pair, triplet or sequence with tile ``index``."""
+    if index >= 27:
+        return 1 << index
+    low = index - index % 9
+    return sum(1 << j for j in range(max(low, index - 2), min(low + 9, index + 3)))
+
+
+_REACH_BITS = tuple(_reach_bits(index) for index in range(34))
+
+# Winning tiles keyed by the concealed tile counts. Keys are content, so
+# entries never go stale.
+_waits_cache: BoundedCache[bytes, FrozenSet[Tile]] = BoundedCache()
+
+
+def _wait_candidates(counts: bytearray) -> int:
+    """Bitmask of the kinds that could complete a hand with these counts.
+
+    A winning tile always joins a held tile in a pair, triplet or sequence,
+    except for kokushi, which only needs the hand to be all terminals and
+    honors.
+    """
+    bits = 0
+    for index in range(34):
+        if counts[index]:
+            bits |= _REACH_BITS[index]
+    if sum(counts[i] for i in _KOKUSHI_INDICES) == sum(counts):
+        bits |= _KOKUSHI_BITS
+    return bits
 
 
 @dataclass
@@ -15,7 +54,7 @@ class Meld:
         if len(self.tiles) == 2:
             return "pair"
         elif len(self.tiles) == 3:
-            if all(t == self.tiles[0] for t in self.tiles):
+            if self._is_three_of_a_kind():
                 return "triplet"
             else:
                 return "sequence"
@@ -23,14 +62,21 @@ class Meld:
             return "kan"
         return "unknown"
 
+    # The predicates test the tiles directly rather than going through
+    # meld_type; the kind is not stored because upgrading a pon to a kan
+    # appends to ``tiles``.
+    def _is_three_of_a_kind(self) -> bool:
+        tiles = self.tiles
+        return tiles[0] == tiles[1] == tiles[2]
+
     def is_sequence(self) -> bool:
-        return self.meld_type == "sequence"
+        return len(self.tiles) == 3 and not self._is_three_of_a_kind()
 
     def is_triplet(self) -> bool:
-        return self.meld_type == "triplet"
+        return len(self.tiles) == 3 and self._is_three_of_a_kind()
 
     def is_kan(self) -> bool:
-        return self.meld_type == "kan"
+        return len(self.tiles) == 4
 
 
 class Hand:
@@ -74,6 +120,26 @@ class Hand:
         """Add completed meld"""
         self.melds.append(meld)
 
+    @property
+    def kan_count(self) -> int:
+        """Number of kan melds (open, closed or added)"""
+        return sum(1 for meld in self.melds if len(meld.tiles) == 4)
+
+    def fingerprint(self) -> tuple:
+        """Hashable key for the tiles, melds and riichi/closed state.
+
+        Red fives are not distinguished, so dora must be counted separately.
+        """
+        return (
+            bytes(tile_counts(self.concealed_tiles)),
+            tuple(
+                (tuple(tile.index for tile in meld.tiles), meld.is_open)
+                for meld in self.melds
+            ),
+            self.is_riichi,
+            self.is_closed(),
+        )
+
     def is_closed(self) -> bool:
         """Check if hand is closed (no open melds)"""
         return all(not meld.is_open for meld in self.melds)
@@ -84,62 +150,78 @@ class Hand:
 
     def get_winning_tiles(self) -> Set[Tile]:
         """Get all tiles that would complete the hand"""
-        winning_tiles = set()
+        if len(self.concealed_tiles) != 13:
+            return set()
+
+        counts = tile_counts(self.concealed_tiles)
+        key = bytes(counts)
+        waits = _waits_cache.get(key)
+        if waits is None:
+            waits = frozenset(self._search_waits(counts))
+            _waits_cache.put(key, waits)
+        return set(waits)
+
+    def _search_waits(self, counts: bytearray) -> List[Tile]:
+        # Try each reachable tile kind on one count vector
+        winning_tiles = []
+        candidates = _wait_candidates(counts)
+        for tile in TILE_KINDS:
+            if not candidates >> tile.index & 1:
+                continue
+            counts[tile.index] += 1
+            if self._is_complete_counts(counts):
+                winning_tiles.append(tile)
+            counts[tile.index] -= 1
+        return winning_tiles
 
-        # Try each possible tile
-        all_possible_tiles = self._get_all_possible_tiles()
-        for tile in all_possible_tiles:
-            test_hand = self.concealed_tiles + [tile]
-            if self._is_complete_hand(test_hand):
-                winning_tiles.add(tile)
+    def is_winning_tile(self, tile: Tile) -> bool:
+        """Whether ``tile`` would complete the hand (``tile in get_winning_tiles()``)"""
+        if len(self.concealed_tiles) != 13:
+            return False
 
-        return winning_tiles
+        counts = tile_counts(self.concealed_tiles)
+        waits = _waits_cache.get(bytes(counts))
+        if waits is not None:
+            return tile in waits
+        counts[tile.index] += 1
+        return self._is_complete_counts(counts)
 
     def get_winning_tiles_with_fixed_melds(
         self, concealed_tiles: List[Tile], fixed_melds: int
     ) -> Set[Tile]:
         """Get winning tiles for a hand with fixed melds (e.g., after kan)."""
         winning_tiles = set()
-        all_possible_tiles = self._get_all_possible_tiles()
-
-        for tile in all_possible_tiles:
-            test_tiles = concealed_tiles + [tile]
-            if self._is_complete_standard_hand(test_tiles, fixed_melds):
+        melds_needed = 4 - fixed_melds
+        if melds_needed < 0 or len(concealed_tiles) != 1 + melds_needed * 3:
+            return winning_tiles
+
+        counts = tile_counts(concealed_tiles)
+        candidates = _wait_candidates(counts)
+        for tile in TILE_KINDS:
+            if not candidates >> tile.index & 1:
+                continue
+            counts[tile.index] += 1
+            if is_standard_hand(counts):
                 winning_tiles.add(tile)
+            counts[tile.index] -= 1
 
         return winning_tiles
-
-    def _get_all_possible_tiles(self) -> List[Tile]:
-        """Get all possible tiles in the game"""
-        tiles = []
-        # Number tiles
-        for suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            for value in range(1, 10):
-                tiles.append(Tile(suit, value))
-        # Honor tiles
-        from tiles.tile import Dragon, Wind
-
-        for wind in Wind:
-            tiles.append(Tile(Suit.WIND, wind=wind))
-        for dragon in Dragon:
-            tiles.append(Tile(Suit.DRAGON, dragon=dragon))
-        return tiles
 
     def _is_complete_hand(self, tiles: List[Tile]) -> bool:
         """Check if tiles form a complete winning hand"""
         if len(tiles) != 14:
             return False
 
-        if self._is_kokushi(tiles):
-            return True
-
-        if self._is_chiitoitsu(tiles):
-            return True
-
-        if self._is_complete_standard_hand(tiles, fixed_melds=0):
-            return True
+        return self._is_complete_counts(tile_counts(tiles))
 
-        return False
+    @staticmethod
+    def _is_complete_counts(counts: bytearray) -> bool:
+        """Check a 14-tile count vector for kokushi, seven pairs or melds."""
+        return (
+            Hand._is_kokushi_counts(counts)
+            or counts.count(2) == 7
+            or is_standard_hand(counts)
+        )
 
     def _is_complete_standard_hand(self, tiles: List[Tile], fixed_melds: int) -> bool:
         """Check if tiles form a standard hand with fixed melds."""
@@ -150,108 +232,39 @@ class Hand:
         if len(tiles) != 2 + melds_needed * 3:
             return False
 
-        # Try to find a pair and remove it
-        for tile in set(tiles):
-            if tiles.count(tile) >= 2:
-                remaining = tiles[:]
-                remaining.remove(tile)
-                remaining.remove(tile)
-
-                if self._can_form_melds(remaining, melds_needed):
-                    return True
-
-        return False
-
-    def _can_form_melds(self, tiles: List[Tile], melds_needed: int) -> bool:
-        """Check if tiles can form the remaining melds (triplets/sequences)."""
-        if melds_needed == 0:
-            return len(tiles) == 0
-        if len(tiles) != melds_needed * 3:
-            return False
-
-        tiles_sorted = tiles[:]
-        tiles_sorted.sort(key=lambda t: (t.suit.value, t.value or 0))
-
-        # Try to form triplet first
-        first_tile = tiles_sorted[0]
-        if tiles_sorted.count(first_tile) >= 3:
-            # Remove triplet
-            triplet_remaining = tiles_sorted[:]
-            for _ in range(3):
-                triplet_remaining.remove(first_tile)
-            if self._can_form_melds(triplet_remaining, melds_needed - 1):
-                return True
-
-        # Try to form sequence (only for number tiles)
-        if (
-            first_tile.suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]
-            and first_tile.value <= 7
-        ):
-            tile2 = Tile(first_tile.suit, first_tile.value + 1)
-            tile3 = Tile(first_tile.suit, first_tile.value + 2)
-
-            if tile2 in tiles_sorted and tile3 in tiles_sorted:
-                # Remove sequence
-                sequence_remaining = tiles_sorted[:]
-                sequence_remaining.remove(first_tile)
-                sequence_remaining.remove(tile2)
-                sequence_remaining.remove(tile3)
-                if self._can_form_melds(sequence_remaining, melds_needed - 1):
-                    return True
-
-        return False
+        return is_standard_hand(tile_counts(tiles))
 
     def _is_chiitoitsu(self, tiles: List[Tile]) -> bool:
         """Check for seven pairs."""
         if len(tiles) != 14:
             return False
 
-        pair_counts = [tiles.count(tile) for tile in set(tiles)]
-        return len(pair_counts) == 7 and all(count == 2 for count in pair_counts)
+        return tile_counts(tiles).count(2) == 7
 
     def _is_kokushi(self, tiles: List[Tile]) -> bool:
         """Check for thirteen orphans."""
         if len(tiles) != 14:
             return False
 
-        terminals_and_honors = []
-        for suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            terminals_and_honors.append(Tile(suit, 1))
-            terminals_and_honors.append(Tile(suit, 9))
-
-        from tiles.tile import Dragon, Wind
-
-        for wind in Wind:
-            terminals_and_honors.append(Tile(Suit.WIND, wind=wind))
-        for dragon in Dragon:
-            terminals_and_honors.append(Tile(Suit.DRAGON, dragon=dragon))
-
-        unique_needed = set(terminals_and_honors)
-        tile_set = set(tiles)
-
-        if not unique_needed.issubset(tile_set):
-            return False
-
-        # Must have one duplicate among terminals/honors
-        for tile in unique_needed:
-            if tiles.count(tile) >= 2:
-                return True
-
-        return False
+        return self._is_kokushi_counts(tile_counts(tiles))
 
+    @staticmethod
+    def _is_kokushi_counts(counts: bytearray) -> bool:
+        # Every terminal and honor present, and all fourteen tiles among them
+        # (so exactly one is doubled).
+        return all(counts[i] for i in _KOKUSHI_INDICES) and (
+            sum(counts[i] for i in _KOKUSHI_INDICES) == 14
+        )
 
     def check_furiten(self, all_discards: Optional[List[List[Tile]]] = None) -> bool:
         """Check permanent furiten state (own discard furiten)."""
-        winning_tiles = self.get_winning_tiles()
-
-        # Check own discards
-        for tile in self.discards:
-            if tile in winning_tiles:
-                self.furiten_state = True
-                return True
-
-        self.furiten_state = False
-        return False
+        # With no discards there is nothing to match, so skip the wait search
+        if not self.discards:
+            self.furiten_state = False
+        else:
+            waits = self.get_winning_tiles()
+            self.furiten_state = any(tile in waits for tile in self.discards)
+        return self.furiten_state
 
     def declare_riichi(self, turn: int):
         """Declare riichi"""
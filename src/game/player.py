@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from game.decomposition import TILE_KINDS, tile_counts
 from game.hand import Hand, Meld
 from tiles.tile import Tile, Wind
 
@@ -34,22 +35,17 @@ class Player:
             return []
 
         possible_sequences = []
+        counts = tile_counts(self.hand.concealed_tiles)
 
         # Check for sequences where discarded tile completes them
         for offset in [-2, -1, 0]:  # Tile can be 1st, 2nd, or 3rd in sequence
             if tile.value + offset < 1 or tile.value + offset > 7:
                 continue
 
-            needed_tiles = []
-            for i in range(3):
-                if i == -offset:  # This is the discarded tile position
-                    continue
-                needed_tiles.append(Tile(tile.suit, tile.value + offset + i))
-
-            # Check if we have the needed tiles
-            if all(t in self.hand.concealed_tiles for t in needed_tiles):
-                sequence = [Tile(tile.suit, tile.value + offset + i) for i in range(3)]
-                possible_sequences.append(sequence)
+            start = tile.index + offset
+            # Every other position must be held; the discard fills its own
+            if all(counts[start + i] for i in range(3) if i != -offset):
+                possible_sequences.append(list(TILE_KINDS[start : start + 3]))
 
         return possible_sequences
 
@@ -66,7 +62,7 @@ class Player:
         if self.hand.furiten_state or self.hand.temp_furiten:
             return False
 
-        return tile in self.hand.get_winning_tiles()
+        return self.hand.is_winning_tile(tile)
 
     def can_tsumo(self) -> bool:
         """Check if player can call tsumo (self-draw win)"""
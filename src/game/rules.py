@@ -1,17 +1,129 @@
+from collections import Counter
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from game.hand import Hand, Meld
+from game.decomposition import (
+    DRAGON_MASK,
+    HONOR_MASK,
+    SUIT_MASKS,
+    TERMINAL_HONOR_MASK,
+    TERMINAL_MASK,
+    TILE_KINDS,
+    WIND_BITS,
+    MeldCode,
+    meld_tiles,
+    standard_decompositions,
+    tile_counts,
+    tile_mask,
+)
+from game.hand import Hand
 from tiles.tile import Dragon, Suit, Tile, Wind
+from utils.cache import BoundedCache
 
+_DECOMPOSITION_FEATURES = (
+    "chanta",
+    "junchan",
+    "all_triplets",
+    "shousangen",
+    "daisangen",
+    "shousuushii",
+    "daisuushii",
+    "iipeikou",
+    "ryanpeikou",
+    "sanshoku_doujun",
+    "sanshoku_doukou",
+    "ittsu",
+)
 
-@dataclass
+_GREEN_TILES = frozenset(
+    [Tile(Suit.SOUZU, value) for value in (2, 3, 4, 6, 8)]
+    + [Tile(Suit.DRAGON, dragon=Dragon.GREEN)]
+)
+
+# check_all_yaku results (without dora) keyed by hand fingerprint and win
+# context. Keys are plain value tuples, so entries never go stale.
+_yaku_cache: BoundedCache[tuple, tuple] = BoundedCache()
+
+
+# Tile kinds allowed in ryuuiisou
+_GREEN_MASK = tile_mask(_GREEN_TILES)
+# Per-value counts of a pure nine gates before the winning tile (1112345678999)
+_CHUUREN_COUNTS = bytes((3, 1, 1, 1, 1, 1, 1, 1, 3))
+
+
+def _value_tile_mask(seat_wind: Wind, round_wind: Wind) -> int:
+    """Mask of the tile kinds that score yakuhai: dragons and the two winds"""
+    return DRAGON_MASK | WIND_BITS[seat_wind] | WIND_BITS[round_wind]
+
+
+@dataclass(frozen=True)
 class Yaku:
     name: str
     han: int
     closed_only: bool = False
 
 
+# Fixed yaku are shared, immutable instances; Yakuhai and Dora vary per hand
+# and are shared per han count through _counted_yaku.
+_YAKU_TENHOU = Yaku("Tenhou", 13, closed_only=True)
+_YAKU_CHIIHOU = Yaku("Chiihou", 13, closed_only=True)
+_YAKU_KOKUSHI_MUSOU_13_WAIT = Yaku("Kokushi Musou 13-Wait", 26, closed_only=True)
+_YAKU_KOKUSHI_MUSOU = Yaku("Kokushi Musou", 13, closed_only=True)
+_YAKU_DAISANGEN = Yaku("Daisangen", 13)
+_YAKU_SUUANKOU_TANKI = Yaku("Suuankou Tanki", 26, closed_only=True)
+_YAKU_SUUANKOU = Yaku("Suuankou", 13, closed_only=True)
+_YAKU_SUUKANTSU = Yaku("Suukantsu", 13)
+_YAKU_TSUUIISOU = Yaku("Tsuuiisou", 13)
+_YAKU_CHINROUTOU = Yaku("Chinroutou", 13)
+_YAKU_RYUUIISOU = Yaku("Ryuuiisou", 13)
+_YAKU_JUNSEI_CHUUREN_POUTOU = Yaku("Junsei Chuuren Poutou", 26, closed_only=True)
+_YAKU_CHUUREN_POUTOU = Yaku("Chuuren Poutou", 13, closed_only=True)
+_YAKU_SHOUSUUSHII = Yaku("Shousuushii", 13)
+_YAKU_DAISUUSHII = Yaku("Daisuushii", 26)
+_YAKU_DOUBLE_RIICHI = Yaku("Double Riichi", 2, closed_only=True)
+_YAKU_RIICHI = Yaku("Riichi", 1, closed_only=True)
+_YAKU_IPPATSU = Yaku("Ippatsu", 1, closed_only=True)
+_YAKU_MENZEN_TSUMO = Yaku("Menzen Tsumo", 1, closed_only=True)
+_YAKU_RINSHAN_KAIHOU = Yaku("Rinshan Kaihou", 1)
+_YAKU_CHANKAN = Yaku("Chankan", 1)
+_YAKU_HAITEI_RAOYUE = Yaku("Haitei Raoyue", 1)
+_YAKU_HOUTEI_RAOYUI = Yaku("Houtei Raoyui", 1)
+_YAKU_TANYAO = Yaku("Tanyao", 1)
+_YAKU_PINFU = Yaku("Pinfu", 1, closed_only=True)
+_YAKU_CHIITOITSU = Yaku("Chiitoitsu", 2, closed_only=True)
+_YAKU_RYANPEIKOU = Yaku("Ryanpeikou", 3, closed_only=True)
+_YAKU_IIPEIKOU = Yaku("Iipeikou", 1, closed_only=True)
+_YAKU_TOITOI = Yaku("Toitoi", 2)
+_YAKU_SANSHOKU_DOUKOU = Yaku("Sanshoku Doukou", 2)
+_YAKU_SANANKOU = Yaku("Sanankou", 2)
+_YAKU_SANKANTSU = Yaku("Sankantsu", 2)
+_YAKU_HONROUTOU = Yaku("Honroutou", 2)
+_YAKU_SHOUSANGEN = Yaku("Shousangen", 2)
+_YAKU_HONITSU_CLOSED = Yaku("Honitsu", 3)
+_YAKU_HONITSU_OPEN = Yaku("Honitsu", 2)
+_YAKU_CHINITSU_CLOSED = Yaku("Chinitsu", 6)
+_YAKU_CHINITSU_OPEN = Yaku("Chinitsu", 5)
+_YAKU_SANSHOKU_DOUJUN_CLOSED = Yaku("Sanshoku Doujun", 2)
+_YAKU_SANSHOKU_DOUJUN_OPEN = Yaku("Sanshoku Doujun", 1)
+_YAKU_ITTSU_CLOSED = Yaku("Ittsu", 2)
+_YAKU_ITTSU_OPEN = Yaku("Ittsu", 1)
+_YAKU_CHANTA_CLOSED = Yaku("Chanta", 2)
+_YAKU_CHANTA_OPEN = Yaku("Chanta", 1)
+_YAKU_JUNCHAN_CLOSED = Yaku("Junchan", 3)
+_YAKU_JUNCHAN_OPEN = Yaku("Junchan", 2)
+
+_COUNTED_YAKU: Dict[Tuple[str, int], Yaku] = {}
+
+
+def _counted_yaku(name: str, han: int) -> Yaku:
+    """Shared Yaku instance for a per-hand count such as Dora or Yakuhai"""
+    key = (name, han)
+    yaku = _COUNTED_YAKU.get(key)
+    if yaku is None:
+        yaku = _COUNTED_YAKU[key] = Yaku(name, han)
+    return yaku
+
+
 class YakuChecker:
     """Check for yaku (winning conditions) in a hand"""
 
@@ -35,143 +147,222 @@ class YakuChecker:
         is_chiihou: bool = False,
     ) -> List[Yaku]:
         """Check all possible yaku for a winning hand"""
-        yaku_list = []
+        context = {
+            "is_ippatsu": is_ippatsu,
+            "is_double_riichi": is_double_riichi,
+            "is_rinshan": is_rinshan,
+            "is_chankan": is_chankan,
+            "is_haitei": is_haitei,
+            "is_houtei": is_houtei,
+            "is_tenhou": is_tenhou,
+            "is_chiihou": is_chiihou,
+        }
+        key = (
+            hand.fingerprint(),
+            winning_tile.index,
+            is_tsumo,
+            seat_wind,
+            round_wind,
+            tuple(context.values()),
+        )
+        cached = _yaku_cache.get(key)
+        if cached is None:
+            cached = tuple(
+                YakuChecker._evaluate_yaku(
+                    hand, winning_tile, is_tsumo, seat_wind, round_wind, **context
+                )
+            )
+            _yaku_cache.put(key, cached)
+
+        yaku_list = list(cached)
+        if any(yaku.han >= 13 for yaku in yaku_list):
+            return yaku_list
+
+        # Add dora only for non-yakuman wins. Dora indicators change every
+        # round, so they are counted outside the cache.
         all_tiles = hand.get_all_tiles()
+        counts = tile_counts(all_tiles)
+        # Red fives are always dora, counted once even when ura dora apply.
+        dora_count = sum(1 for tile in all_tiles if tile.is_red)
+        dora_count += YakuChecker._count_dora(counts, dora_tiles)
+        if hand.is_riichi and ura_dora_tiles:
+            dora_count += YakuChecker._count_dora(counts, ura_dora_tiles)
 
-        # Situational yaku
-        if YakuChecker._check_tenhou(hand, is_tsumo, is_tenhou):
-            yaku_list.append(Yaku("Tenhou", 13, closed_only=True))
-
-        if YakuChecker._check_chiihou(hand, is_tsumo, is_chiihou):
-            yaku_list.append(Yaku("Chiihou", 13, closed_only=True))
-
-        if YakuChecker._check_double_riichi(hand, is_double_riichi):
-            yaku_list.append(Yaku("Double Riichi", 2, closed_only=True))
-        elif YakuChecker._check_riichi(hand):
-            yaku_list.append(Yaku("Riichi", 1, closed_only=True))
-
-        if YakuChecker._check_ippatsu(hand, is_ippatsu):
-            yaku_list.append(Yaku("Ippatsu", 1, closed_only=True))
-
-        if YakuChecker._check_menzen_tsumo(hand, is_tsumo):
-            yaku_list.append(Yaku("Menzen Tsumo", 1, closed_only=True))
-
-        if YakuChecker._check_rinshan(is_tsumo, is_rinshan):
-            yaku_list.append(Yaku("Rinshan Kaihou", 1))
-
-        if YakuChecker._check_chankan(is_tsumo, is_chankan):
-            yaku_list.append(Yaku("Chankan", 1))
-
-        if YakuChecker._check_haitei(is_tsumo, is_haitei):
-            yaku_list.append(Yaku("Haitei Raoyue", 1))
-
-        if YakuChecker._check_houtei(is_tsumo, is_houtei):
-            yaku_list.append(Yaku("Houtei Raoyui", 1))
-
-        # Shape/composition yaku
-        if YakuChecker._check_tanyao(all_tiles):
-            yaku_list.append(Yaku("Tanyao", 1))
-
-        if YakuChecker._check_pinfu(hand, winning_tile, seat_wind, round_wind):
-            yaku_list.append(Yaku("Pinfu", 1, closed_only=True))
-
-        if YakuChecker._check_chiitoitsu(hand, winning_tile):
-            yaku_list.append(Yaku("Chiitoitsu", 2, closed_only=True))
-
-        if YakuChecker._check_kokushi_13_wait(hand, winning_tile):
-            yaku_list.append(Yaku("Kokushi Musou 13-Wait", 26, closed_only=True))
-        elif YakuChecker._check_kokushi(hand, winning_tile):
-            yaku_list.append(Yaku("Kokushi Musou", 13, closed_only=True))
-
-        yakuhai_count = YakuChecker._check_yakuhai(hand, seat_wind, round_wind, winning_tile)
-        for _ in range(yakuhai_count):
-            yaku_list.append(Yaku("Yakuhai", 1))
-
-        if YakuChecker._check_ryanpeikou(hand, winning_tile):
-            yaku_list.append(Yaku("Ryanpeikou", 3, closed_only=True))
-        elif YakuChecker._check_iipeikou(hand, winning_tile):
-            yaku_list.append(Yaku("Iipeikou", 1, closed_only=True))
+        if dora_count > 0:
+            yaku_list.append(_counted_yaku("Dora", dora_count))
 
-        if YakuChecker._check_toitoi(hand, winning_tile):
-            yaku_list.append(Yaku("Toitoi", 2))
+        return yaku_list
 
-        if YakuChecker._check_honitsu(all_tiles):
-            han = 3 if hand.is_closed() else 2
-            yaku_list.append(Yaku("Honitsu", han))
-
-        if YakuChecker._check_chinitsu(all_tiles):
-            han = 6 if hand.is_closed() else 5
-            yaku_list.append(Yaku("Chinitsu", han))
+    @staticmethod
+    def _evaluate_yaku(
+        hand: Hand,
+        winning_tile: Tile,
+        is_tsumo: bool,
+        seat_wind: Wind,
+        round_wind: Wind,
+        *,
+        is_ippatsu: bool,
+        is_double_riichi: bool,
+        is_rinshan: bool,
+        is_chankan: bool,
+        is_haitei: bool,
+        is_houtei: bool,
+        is_tenhou: bool,
+        is_chiihou: bool,
+    ) -> List[Yaku]:
+        yaku_list = []
+        all_tiles = hand.get_all_tiles()
+        is_closed = hand.is_closed()
+        kan_count = hand.kan_count
+        # Tile-kind masks shared by every composition check below; the
+        # complete mask adds the winning tile when it is not yet in hand.
+        hand_mask = tile_mask(all_tiles)
+        complete_mask = hand_mask
+        if len(all_tiles) == 13:
+            complete_mask |= 1 << winning_tile.index
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        features = YakuChecker._decomposition_features(decompositions)
+
+        # Yakuman do not stack with regular yaku or dora, so check them first
+        # and skip the remaining decomposition scans when any is present.
+        if YakuChecker._check_tenhou(hand, is_tsumo, is_tenhou):
+            yaku_list.append(_YAKU_TENHOU)
 
-        if YakuChecker._check_sanshoku_doujun(hand, winning_tile):
-            yaku_list.append(Yaku("Sanshoku Doujun", 2 if hand.is_closed() else 1))
+        if YakuChecker._check_chiihou(hand, is_tsumo, is_chiihou):
+            yaku_list.append(_YAKU_CHIIHOU)
 
-        if YakuChecker._check_sanshoku_doukou(hand, winning_tile):
-            yaku_list.append(Yaku("Sanshoku Doukou", 2))
+        if is_closed and YakuChecker._check_kokushi_13_wait(hand, winning_tile):
+            yaku_list.append(_YAKU_KOKUSHI_MUSOU_13_WAIT)
+        elif is_closed and YakuChecker._check_kokushi(hand, winning_tile):
+            yaku_list.append(_YAKU_KOKUSHI_MUSOU)
 
-        if YakuChecker._check_ittsu(hand, winning_tile):
-            yaku_list.append(Yaku("Ittsu", 2 if hand.is_closed() else 1))
+        if features["daisangen"]:
+            yaku_list.append(_YAKU_DAISANGEN)
 
-        if YakuChecker._check_sanankou(hand, winning_tile, is_tsumo):
-            yaku_list.append(Yaku("Sanankou", 2))
+        if is_closed and YakuChecker._check_suuankou_tanki(
+            hand, winning_tile, is_tsumo
+        ):
+            yaku_list.append(_YAKU_SUUANKOU_TANKI)
+        elif is_closed and YakuChecker._check_suuankou(hand, winning_tile, is_tsumo):
+            yaku_list.append(_YAKU_SUUANKOU)
 
-        if YakuChecker._check_sankantsu(hand):
-            yaku_list.append(Yaku("Sankantsu", 2))
+        if kan_count == 4:
+            yaku_list.append(_YAKU_SUUKANTSU)
 
-        if YakuChecker._check_chanta(hand, winning_tile):
-            yaku_list.append(Yaku("Chanta", 2 if hand.is_closed() else 1))
+        if YakuChecker._check_tsuuiisou(complete_mask):
+            yaku_list.append(_YAKU_TSUUIISOU)
 
-        if YakuChecker._check_junchan(hand, winning_tile):
-            yaku_list.append(Yaku("Junchan", 3 if hand.is_closed() else 2))
+        if YakuChecker._check_chinroutou(complete_mask):
+            yaku_list.append(_YAKU_CHINROUTOU)
 
-        if YakuChecker._check_honroutou(hand, winning_tile):
-            yaku_list.append(Yaku("Honroutou", 2))
+        if YakuChecker._check_ryuuiisou(complete_mask):
+            yaku_list.append(_YAKU_RYUUIISOU)
 
-        if YakuChecker._check_shousangen(hand, winning_tile):
-            yaku_list.append(Yaku("Shousangen", 2))
+        if is_closed and YakuChecker._check_junsei_chuuren_poutou(hand, winning_tile):
+            yaku_list.append(_YAKU_JUNSEI_CHUUREN_POUTOU)
+        elif is_closed and YakuChecker._check_chuuren_poutou(hand, winning_tile):
+            yaku_list.append(_YAKU_CHUUREN_POUTOU)
 
-        if YakuChecker._check_daisangen(hand, winning_tile):
-            yaku_list.append(Yaku("Daisangen", 13))
+        if features["shousuushii"]:
+            yaku_list.append(_YAKU_SHOUSUUSHII)
 
-        if YakuChecker._check_suuankou_tanki(hand, winning_tile, is_tsumo):
-            yaku_list.append(Yaku("Suuankou Tanki", 26, closed_only=True))
-        elif YakuChecker._check_suuankou(hand, winning_tile, is_tsumo):
-            yaku_list.append(Yaku("Suuankou", 13, closed_only=True))
+        if features["daisuushii"]:
+            yaku_list.append(_YAKU_DAISUUSHII)
 
-        if YakuChecker._check_suukantsu(hand):
-            yaku_list.append(Yaku("Suukantsu", 13))
+        if yaku_list:
+            return yaku_list
 
-        if YakuChecker._check_tsuuiisou(hand, winning_tile):
-            yaku_list.append(Yaku("Tsuuiisou", 13))
+        # Situational yaku
+        if YakuChecker._check_double_riichi(hand, is_double_riichi):
+            yaku_list.append(_YAKU_DOUBLE_RIICHI)
+        elif YakuChecker._check_riichi(hand):
+            yaku_list.append(_YAKU_RIICHI)
 
-        if YakuChecker._check_chinroutou(hand, winning_tile):
-            yaku_list.append(Yaku("Chinroutou", 13))
+        if YakuChecker._check_ippatsu(hand, is_ippatsu):
+            yaku_list.append(_YAKU_IPPATSU)
 
-        if YakuChecker._check_ryuuiisou(hand, winning_tile):
-            yaku_list.append(Yaku("Ryuuiisou", 13))
+        if is_closed and is_tsumo:
+            yaku_list.append(_YAKU_MENZEN_TSUMO)
 
-        if YakuChecker._check_junsei_chuuren_poutou(hand, winning_tile):
-            yaku_list.append(Yaku("Junsei Chuuren Poutou", 26, closed_only=True))
-        elif YakuChecker._check_chuuren_poutou(hand, winning_tile):
-            yaku_list.append(Yaku("Chuuren Poutou", 13, closed_only=True))
+        if YakuChecker._check_rinshan(is_tsumo, is_rinshan):
+            yaku_list.append(_YAKU_RINSHAN_KAIHOU)
 
-        if YakuChecker._check_shousuushii(hand, winning_tile):
-            yaku_list.append(Yaku("Shousuushii", 13))
+        if YakuChecker._check_chankan(is_tsumo, is_chankan):
+            yaku_list.append(_YAKU_CHANKAN)
 
-        if YakuChecker._check_daisuushii(hand, winning_tile):
-            yaku_list.append(Yaku("Daisuushii", 26))
+        if YakuChecker._check_haitei(is_tsumo, is_haitei):
+            yaku_list.append(_YAKU_HAITEI_RAOYUE)
 
-        yakuman = [yaku for yaku in yaku_list if yaku.han >= 13]
-        if yakuman:
-            return yakuman
+        if YakuChecker._check_houtei(is_tsumo, is_houtei):
+            yaku_list.append(_YAKU_HOUTEI_RAOYUI)
 
-        # Add dora only for non-yakuman wins
-        dora_count = YakuChecker._count_dora(all_tiles, dora_tiles)
-        if hand.is_riichi and ura_dora_tiles:
-            dora_count += YakuChecker._count_dora(all_tiles, ura_dora_tiles)
-
-        if dora_count > 0:
-            yaku_list.append(Yaku("Dora", dora_count))
+        # Shape/composition yaku
+        if YakuChecker._check_tanyao(hand_mask):
+            yaku_list.append(_YAKU_TANYAO)
+
+        # Pinfu needs a fully concealed hand of sequences, so any called or
+        # concealed kan rules it out before the sequence-only search runs.
+        if (
+            is_closed
+            and not hand.melds
+            and YakuChecker._check_pinfu(hand, winning_tile, seat_wind, round_wind)
+        ):
+            yaku_list.append(_YAKU_PINFU)
+
+        if is_closed and YakuChecker._check_chiitoitsu(hand, winning_tile):
+            yaku_list.append(_YAKU_CHIITOITSU)
+
+        yakuhai_count = YakuChecker._count_yakuhai(
+            decompositions, seat_wind, round_wind
+        )
+        if yakuhai_count:
+            yaku_list.append(_counted_yaku("Yakuhai", yakuhai_count))
+
+        if is_closed and features["ryanpeikou"]:
+            yaku_list.append(_YAKU_RYANPEIKOU)
+        elif is_closed and features["iipeikou"]:
+            yaku_list.append(_YAKU_IIPEIKOU)
+
+        if features["all_triplets"]:
+            yaku_list.append(_YAKU_TOITOI)
+
+        if YakuChecker._check_chinitsu(hand_mask):
+            yaku_list.append(
+                _YAKU_CHINITSU_CLOSED if is_closed else _YAKU_CHINITSU_OPEN
+            )
+        elif YakuChecker._check_honitsu(hand_mask):
+            yaku_list.append(_YAKU_HONITSU_CLOSED if is_closed else _YAKU_HONITSU_OPEN)
+
+        if features["sanshoku_doujun"]:
+            yaku_list.append(
+                _YAKU_SANSHOKU_DOUJUN_CLOSED
+                if is_closed
+                else _YAKU_SANSHOKU_DOUJUN_OPEN
+            )
+
+        if features["sanshoku_doukou"]:
+            yaku_list.append(_YAKU_SANSHOKU_DOUKOU)
+
+        if features["ittsu"]:
+            yaku_list.append(_YAKU_ITTSU_CLOSED if is_closed else _YAKU_ITTSU_OPEN)
+
+        if YakuChecker._has_sanankou(hand, winning_tile, is_tsumo, decompositions):
+            yaku_list.append(_YAKU_SANANKOU)
+
+        if kan_count >= 3:
+            yaku_list.append(_YAKU_SANKANTSU)
+
+        # Junchan is the stricter form of chanta and replaces it
+        if features["junchan"]:
+            yaku_list.append(_YAKU_JUNCHAN_CLOSED if is_closed else _YAKU_JUNCHAN_OPEN)
+        elif features["chanta"]:
+            yaku_list.append(_YAKU_CHANTA_CLOSED if is_closed else _YAKU_CHANTA_OPEN)
+
+        if YakuChecker._is_honroutou(hand, winning_tile, complete_mask, features):
+            yaku_list.append(_YAKU_HONROUTOU)
+
+        if features["shousangen"]:
+            yaku_list.append(_YAKU_SHOUSANGEN)
 
         return yaku_list
 
@@ -216,9 +407,9 @@ class YakuChecker:
         return hand.is_closed() and is_tsumo and is_chiihou
 
     @staticmethod
-    def _check_tanyao(tiles: List[Tile]) -> bool:
+    def _check_tanyao(mask: int) -> bool:
         """All simples - no terminals or honors"""
-        return all(not tile.is_terminal_or_honor() for tile in tiles)
+        return (mask & TERMINAL_HONOR_MASK) == 0
 
     @staticmethod
     def _check_pinfu(
@@ -242,77 +433,28 @@ class YakuChecker:
         tiles: List[Tile], winning_tile: Tile, seat_wind: Wind, round_wind: Wind
     ) -> bool:
         """Check if tiles can form pinfu with a ryanmen wait."""
-        for pair_tile in set(tiles):
-            if tiles.count(pair_tile) < 2:
+        counts = tile_counts(tiles)
+        value_mask = _value_tile_mask(seat_wind, round_wind)
+        for melds, pair in standard_decompositions(counts, allow_triplets=False):
+            if (value_mask >> pair) & 1:
                 continue
-
-            if pair_tile.is_honor():
-                if pair_tile.suit == Suit.WIND and (
-                    pair_tile.wind == seat_wind or pair_tile.wind == round_wind
-                ):
-                    continue
-                if pair_tile.suit == Suit.DRAGON:
-                    continue
-
-            remaining = tiles[:]
-            remaining.remove(pair_tile)
-            remaining.remove(pair_tile)
-
-            sequences: List[List[Tile]] = []
-            if YakuChecker._extract_sequences(remaining, sequences):
-                if YakuChecker._is_ryanmen_wait(
-                    sequences, winning_tile
-                ):
-                    return True
-
-        return False
-
-    @staticmethod
-    def _extract_sequences(tiles: List[Tile], sequences: List[List[Tile]]) -> bool:
-        """Extract sequences only from tiles, recording a valid sequence set."""
-        if not tiles:
-            return True
-
-        tiles.sort(key=lambda t: (t.suit.value, t.value or 0))
-        first_tile = tiles[0]
-
-        if first_tile.suit not in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            return False
-
-        if first_tile.value is None or first_tile.value > 7:
-            return False
-
-        tile2 = Tile(first_tile.suit, first_tile.value + 1)
-        tile3 = Tile(first_tile.suit, first_tile.value + 2)
-
-        if tile2 in tiles and tile3 in tiles:
-            tiles_copy = tiles[:]
-            tiles_copy.remove(first_tile)
-            tiles_copy.remove(tile2)
-            tiles_copy.remove(tile3)
-            sequences.append([first_tile, tile2, tile3])
-            if YakuChecker._extract_sequences(tiles_copy, sequences):
+            if YakuChecker._is_ryanmen_wait(melds, winning_tile.index):
                 return True
-            sequences.pop()
 
         return False
 
     @staticmethod
-    def _is_ryanmen_wait(sequences: List[List[Tile]], winning_tile: Tile) -> bool:
+    def _is_ryanmen_wait(sequences: List[MeldCode], winning_index: int) -> bool:
         """Check if the winning tile completes a two-sided wait."""
-        for sequence in sequences:
-            if winning_tile not in sequence:
+        for _, low in sequences:
+            if not low <= winning_index <= low + 2:
                 continue
 
-            seq = sorted(sequence, key=lambda t: t.value or 0)
-            if winning_tile == seq[1]:
+            if winning_index == low + 1:
                 return False  # middle tile -> kanchan wait
-
-            low = seq[0].value
-            high = seq[2].value
-            if winning_tile == seq[2] and low == 1:
+            if winning_index == low + 2 and low % 9 == 0:
                 return False  # 1-2-3 won on 3 -> edge wait
-            if winning_tile == seq[0] and high == 9:
+            if winning_index == low and low % 9 == 6:
                 return False  # 7-8-9 won on 7 -> edge wait
 
             return True
@@ -332,8 +474,7 @@ class YakuChecker:
         if len(tiles) != 14:
             return False
 
-        pair_counts = [tiles.count(tile) for tile in set(tiles)]
-        return len(pair_counts) == 7 and all(count == 2 for count in pair_counts)
+        return tile_counts(tiles).count(2) == 7
 
     @staticmethod
     def _check_kokushi(hand: Hand, winning_tile: Tile) -> bool:
@@ -348,26 +489,9 @@ class YakuChecker:
         if len(tiles) != 14:
             return False
 
-        terminals_and_honors = []
-        for suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            terminals_and_honors.append(Tile(suit, 1))
-            terminals_and_honors.append(Tile(suit, 9))
-
-        for wind in Wind:
-            terminals_and_honors.append(Tile(Suit.WIND, wind=wind))
-        for dragon in Dragon:
-            terminals_and_honors.append(Tile(Suit.DRAGON, dragon=dragon))
-
-        unique_needed = set(terminals_and_honors)
-        tile_set = set(tiles)
-        if not unique_needed.issubset(tile_set):
-            return False
-
-        for tile in unique_needed:
-            if tiles.count(tile) >= 2:
-                return True
-
-        return False
+        # Fourteen tiles covering exactly the thirteen terminal and honor
+        # kinds must repeat one of them.
+        return tile_mask(tiles) == TERMINAL_HONOR_MASK
 
     @staticmethod
     def _check_kokushi_13_wait(hand: Hand, winning_tile: Tile) -> bool:
@@ -375,16 +499,6 @@ class YakuChecker:
         if not YakuChecker._check_kokushi(hand, winning_tile):
             return False
 
-        terminals_and_honors = []
-        for suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            terminals_and_honors.append(Tile(suit, 1))
-            terminals_and_honors.append(Tile(suit, 9))
-        for wind in Wind:
-            terminals_and_honors.append(Tile(Suit.WIND, wind=wind))
-        for dragon in Dragon:
-            terminals_and_honors.append(Tile(Suit.DRAGON, dragon=dragon))
-        unique_needed = set(terminals_and_honors)
-
         before_tiles = hand.concealed_tiles[:]
         if len(before_tiles) == 14:
             if winning_tile not in before_tiles:
@@ -394,27 +508,30 @@ class YakuChecker:
         if len(before_tiles) != 13:
             return False
 
-        return set(before_tiles) == unique_needed and all(
-            before_tiles.count(tile) == 1 for tile in unique_needed
-        )
+        # Thirteen tiles covering all thirteen kinds means one of each.
+        return tile_mask(before_tiles) == TERMINAL_HONOR_MASK
 
-
     @staticmethod
     def _check_yakuhai(
         hand: Hand, seat_wind: Wind, round_wind: Wind, winning_tile: Tile
     ) -> int:
         """Count yakuhai triplets"""
-        def is_value_tile(tile: Tile) -> bool:
-            if tile.suit == Suit.DRAGON:
-                return True
-            if tile.suit == Suit.WIND and (tile.wind == seat_wind or tile.wind == round_wind):
-                return True
-            return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._count_yakuhai(decompositions, seat_wind, round_wind)
+
+    @staticmethod
+    def _count_yakuhai(
+        decompositions: List[tuple[list[list[Tile]], Tile]],
+        seat_wind: Wind,
+        round_wind: Wind,
+    ) -> int:
+        value_mask = _value_tile_mask(seat_wind, round_wind)
         max_count = 0
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
+        for melds, _ in decompositions:
             count = 0
             for meld in melds:
-                if YakuChecker._is_triplet_meld(meld) and is_value_tile(meld[0]):
+                is_value_tile = (value_mask >> meld[0].index) & 1
+                if is_value_tile and YakuChecker._is_triplet_meld(meld):
                     count += 1
             max_count = max(max_count, count)
         return max_count
@@ -424,86 +541,41 @@ class YakuChecker:
         """Same sequence twice, closed hand only"""
         if not hand.is_closed():
             return False
-
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            sequences = [meld for meld in melds if YakuChecker._is_sequence_meld(meld)]
-            for i, seq1 in enumerate(sequences):
-                for seq2 in sequences[i + 1 :]:
-                    if sorted(seq1, key=lambda t: (t.suit.value, t.value or 0)) == sorted(
-                        seq2, key=lambda t: (t.suit.value, t.value or 0)
-                    ):
-                        return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["iipeikou"]
 
     @staticmethod
     def _check_ryanpeikou(hand: Hand, winning_tile: Tile) -> bool:
         """Two sets of identical sequences in a closed hand."""
         if not hand.is_closed():
             return False
-
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            sequences = [meld for meld in melds if YakuChecker._is_sequence_meld(meld)]
-            if len(sequences) != 4:
-                continue
-
-            counts = {}
-            for meld in sequences:
-                seq = sorted(meld, key=lambda t: (t.suit.value, t.value or 0))
-                key = (seq[0].suit, seq[0].value)
-                counts[key] = counts.get(key, 0) + 1
-
-            if sorted(counts.values()) == [2, 2]:
-                return True
-
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["ryanpeikou"]
 
     @staticmethod
     def _check_toitoi(hand: Hand, winning_tile: Tile) -> bool:
         """All triplets plus a pair"""
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            if all(
-                YakuChecker._is_triplet_meld(meld)
-                for meld in melds
-            ):
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["all_triplets"]
 
     @staticmethod
-    def _check_honitsu(tiles: List[Tile]) -> bool:
+    def _check_honitsu(mask: int) -> bool:
         """Half flush - one suit plus honors"""
-        suits_present = set()
-        has_honors = False
-
-        for tile in tiles:
-            if tile.is_honor():
-                has_honors = True
-            else:
-                suits_present.add(tile.suit)
-
-        return len(suits_present) == 1 and has_honors
+        suits = sum(1 for suit_mask in SUIT_MASKS if mask & suit_mask)
+        return suits == 1 and (mask & HONOR_MASK) != 0
 
     @staticmethod
-    def _check_chinitsu(tiles: List[Tile]) -> bool:
+    def _check_chinitsu(mask: int) -> bool:
         """Full flush - one suit only"""
-        suits_present = set()
-
-        for tile in tiles:
-            if tile.is_honor():
-                return False
-            suits_present.add(tile.suit)
-
-        return len(suits_present) == 1
+        return mask != 0 and any((mask & ~suit_mask) == 0 for suit_mask in SUIT_MASKS)
 
     @staticmethod
-    def _count_dora(tiles: List[Tile], dora_tiles: List[Tile]) -> int:
-        """Count dora tiles in hand"""
-        count = 0
-        for tile in tiles:
-            if tile in dora_tiles:
-                count += 1
-            if tile.is_red:  # Red fives are always dora
-                count += 1
-        return count
+    def _count_dora(counts: bytearray, dora_tiles: List[Tile]) -> int:
+        """Count dora tiles in a hand given its per-kind tile counts.
+
+        A kind named by several indicators counts once per indicator.
+        """
+        return sum(counts[tile.index] for tile in dora_tiles)
 
     @staticmethod
     def _complete_hand_tiles(hand: Hand, winning_tile: Tile) -> List[Tile]:
@@ -516,7 +588,11 @@ class YakuChecker:
     def _standard_decompositions(
         hand: Hand, winning_tile: Tile
     ) -> List[tuple[list[list[Tile]], Tile]]:
-        fixed_melds = [meld.tiles[:] for meld in hand.melds]
+        # Called melds are stored in call order; sort them once so every
+        # decomposed meld is canonical (sequences ascending).
+        fixed_melds = [
+            sorted(meld.tiles, key=lambda t: t.value or 0) for meld in hand.melds
+        ]
         melds_needed = 4 - len(fixed_melds)
         concealed = hand.concealed_tiles[:]
         required_len = 2 + melds_needed * 3
@@ -527,123 +603,58 @@ class YakuChecker:
         if len(concealed) != 2 + melds_needed * 3:
             return []
 
-        results: List[tuple[list[list[Tile]], Tile]] = []
-        for pair_tile in set(concealed):
-            if concealed.count(pair_tile) < 2:
-                continue
-            remaining = concealed[:]
-            remaining.remove(pair_tile)
-            remaining.remove(pair_tile)
-            for melds in YakuChecker._extract_melds(remaining):
-                if len(melds) != melds_needed:
-                    continue
-                results.append((fixed_melds + melds, pair_tile))
-        return results
-
-    @staticmethod
-    def _extract_melds(tiles: List[Tile]) -> List[List[List[Tile]]]:
-        if not tiles:
-            return [[]]
-
-        tiles_sorted = sorted(tiles, key=lambda t: (t.suit.value, t.value or 0))
-        first = tiles_sorted[0]
-        results: List[List[List[Tile]]] = []
-
-        if tiles_sorted.count(first) >= 3:
-            remaining = tiles_sorted[:]
-            for _ in range(3):
-                remaining.remove(first)
-            for melds in YakuChecker._extract_melds(remaining):
-                results.append([[first, first, first]] + melds)
-
-        if first.suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU] and first.value and first.value <= 7:
-            tile2 = Tile(first.suit, first.value + 1)
-            tile3 = Tile(first.suit, first.value + 2)
-            if tile2 in tiles_sorted and tile3 in tiles_sorted:
-                remaining = tiles_sorted[:]
-                remaining.remove(first)
-                remaining.remove(tile2)
-                remaining.remove(tile3)
-                for melds in YakuChecker._extract_melds(remaining):
-                    results.append([[first, tile2, tile3]] + melds)
-
-        return results
+        return [
+            (fixed_melds + [meld_tiles(meld) for meld in melds], TILE_KINDS[pair])
+            for melds, pair in standard_decompositions(tile_counts(concealed))
+        ]
 
     @staticmethod
     def _is_triplet_meld(meld: List[Tile]) -> bool:
-        if len(meld) not in (3, 4):
+        length = len(meld)
+        if length != 3 and length != 4:
             return False
-        return all(tile == meld[0] for tile in meld)
+        first = meld[0]
+        return (
+            first == meld[1] and first == meld[2] and (length == 3 or first == meld[3])
+        )
 
     @staticmethod
     def _is_sequence_meld(meld: List[Tile]) -> bool:
-        if len(meld) != 3:
-            return False
-        if meld[0].suit not in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
+        # Decomposed melds are canonical, so a sequence is already ascending.
+        if len(meld) != 3 or meld[0].value is None:
             return False
-        seq = sorted(meld, key=lambda t: t.value or 0)
-        return (
-            seq[0].value is not None
-            and seq[1].value == seq[0].value + 1
-            and seq[2].value == seq[0].value + 2
-        )
+        start = meld[0].value
+        return meld[1].value == start + 1 and meld[2].value == start + 2
 
     @staticmethod
     def _check_sanshoku_doujun(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            sequences = [
-                meld
-                for meld in melds
-                if YakuChecker._is_sequence_meld(meld)
-            ]
-            for start in range(1, 8):
-                suits = set()
-                for meld in sequences:
-                    seq = sorted(meld, key=lambda t: t.value or 0)
-                    if seq[0].value == start:
-                        suits.add(seq[0].suit)
-                if len(suits) == 3:
-                    return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["sanshoku_doujun"]
 
     @staticmethod
     def _check_ittsu(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            sequences = [
-                meld
-                for meld in melds
-                if YakuChecker._is_sequence_meld(meld)
-            ]
-            for suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-                starts = {
-                    sorted(meld, key=lambda t: t.value or 0)[0].value
-                    for meld in sequences
-                    if meld[0].suit == suit
-                }
-                if {1, 4, 7}.issubset(starts):
-                    return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["ittsu"]
 
     @staticmethod
     def _check_sanshoku_doukou(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            triplets = [
-                meld
-                for meld in melds
-                if YakuChecker._is_triplet_meld(meld)
-                and meld[0].suit in (Suit.SOUZU, Suit.PINZU, Suit.MANZU)
-                and meld[0].value is not None
-            ]
-            for value in range(1, 10):
-                suits = {meld[0].suit for meld in triplets if meld[0].value == value}
-                if len(suits) == 3:
-                    return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["sanshoku_doukou"]
 
     @staticmethod
     def _check_sanankou(hand: Hand, winning_tile: Tile, is_tsumo: bool) -> bool:
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._has_sanankou(hand, winning_tile, is_tsumo, decompositions)
+
+    @staticmethod
+    def _has_sanankou(
+        hand: Hand,
+        winning_tile: Tile,
+        is_tsumo: bool,
+        decompositions: List[tuple[list[list[Tile]], Tile]],
+    ) -> bool:
         fixed_meld_count = len(hand.melds)
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
+        for melds, _ in decompositions:
             concealed_triplets = 0
             for idx, meld in enumerate(melds):
                 if not YakuChecker._is_triplet_meld(meld):
@@ -666,82 +677,128 @@ class YakuChecker:
 
     @staticmethod
     def _check_sankantsu(hand: Hand) -> bool:
-        return sum(1 for meld in hand.melds if meld.is_kan()) >= 3
+        return hand.kan_count >= 3
 
     @staticmethod
-    def _check_chanta(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, pair_tile in YakuChecker._standard_decompositions(hand, winning_tile):
-            if not (pair_tile.is_terminal_or_honor()):
-                continue
+    def _decomposition_features(
+        decompositions: List[tuple[list[list[Tile]], Tile]]
+    ) -> Dict[str, bool]:
+        """Scan decompositions once for every meld-shape based yaku."""
+        features = dict.fromkeys(_DECOMPOSITION_FEATURES, False)
+        for melds, pair_tile in decompositions:
             has_sequence = False
-            valid = True
+            all_triplets = True
+            chanta_melds = True
+            junchan_melds = True
+            dragon_triplets = 0
+            wind_triplets = 0
+            sequences = []
+            number_triplets = []
             for meld in melds:
-                if not any(tile.is_terminal_or_honor() for tile in meld):
-                    valid = False
-                    break
-                if YakuChecker._is_sequence_meld(meld):
+                # Canonical melds only need their first/last tile inspected.
+                low = meld[0].value
+                if YakuChecker._is_triplet_meld(meld):
+                    if meld[0].suit == Suit.DRAGON:
+                        dragon_triplets += 1
+                    elif meld[0].suit == Suit.WIND:
+                        wind_triplets += 1
+                    else:
+                        number_triplets.append((meld[0].suit, low))
+                    has_honor = low is None
+                    has_terminal = low == 1 or low == 9
+                elif YakuChecker._is_sequence_meld(meld):
+                    all_triplets = False
                     has_sequence = True
-            if valid and has_sequence:
-                return True
-        return False
+                    sequences.append((meld[0].suit, low))
+                    has_honor = False
+                    has_terminal = low == 1 or meld[2].value == 9
+                else:
+                    all_triplets = False
+                    has_honor = any(tile.is_honor() for tile in meld)
+                    has_terminal = any(tile.is_terminal() for tile in meld)
+
+                if not (has_honor or has_terminal):
+                    chanta_melds = False
+                    junchan_melds = False
+                elif has_honor or not has_terminal:
+                    junchan_melds = False
+
+            if has_sequence and pair_tile.is_terminal_or_honor() and chanta_melds:
+                features["chanta"] = True
+            if has_sequence and pair_tile.is_terminal() and junchan_melds:
+                features["junchan"] = True
+            if all_triplets:
+                features["all_triplets"] = True
+            if dragon_triplets == 2 and pair_tile.suit == Suit.DRAGON:
+                features["shousangen"] = True
+            if dragon_triplets == 3:
+                features["daisangen"] = True
+            if wind_triplets == 3 and pair_tile.suit == Suit.WIND:
+                features["shousuushii"] = True
+            if wind_triplets == 4:
+                features["daisuushii"] = True
+
+            if sequences:
+                repeats = Counter(sequences).values()
+                if any(count >= 2 for count in repeats):
+                    features["iipeikou"] = True
+                if len(sequences) == 4 and sorted(repeats) == [2, 2]:
+                    features["ryanpeikou"] = True
+                if YakuChecker._has_three_suits(sequences):
+                    features["sanshoku_doujun"] = True
+                if any(
+                    {(suit, 1), (suit, 4), (suit, 7)}.issubset(sequences)
+                    for suit in (Suit.SOUZU, Suit.PINZU, Suit.MANZU)
+                ):
+                    features["ittsu"] = True
+            if YakuChecker._has_three_suits(number_triplets):
+                features["sanshoku_doukou"] = True
+        return features
+
+    @staticmethod
+    def _has_three_suits(melds: Iterable[Tuple[Suit, Optional[int]]]) -> bool:
+        """Whether some value appears in all three suits among (suit, value) keys"""
+        suits_by_value: Dict[Optional[int], Set[Suit]] = {}
+        for suit, value in melds:
+            suits_by_value.setdefault(value, set()).add(suit)
+        return any(len(suits) == 3 for suits in suits_by_value.values())
+
+    @staticmethod
+    def _check_chanta(hand: Hand, winning_tile: Tile) -> bool:
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["chanta"]
 
     @staticmethod
     def _check_junchan(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, pair_tile in YakuChecker._standard_decompositions(hand, winning_tile):
-            if pair_tile.is_honor() or not pair_tile.is_terminal():
-                continue
-            has_sequence = False
-            valid = True
-            for meld in melds:
-                if any(tile.is_honor() for tile in meld):
-                    valid = False
-                    break
-                if not any(tile.is_terminal() for tile in meld):
-                    valid = False
-                    break
-                if YakuChecker._is_sequence_meld(meld):
-                    has_sequence = True
-            if valid and has_sequence:
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["junchan"]
 
     @staticmethod
     def _check_honroutou(hand: Hand, winning_tile: Tile) -> bool:
-        tiles = YakuChecker._complete_hand_tiles(hand, winning_tile)
-        if not all(tile.is_terminal_or_honor() for tile in tiles):
-            return False
-
-        if YakuChecker._check_chiitoitsu(hand, winning_tile):
-            return True
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        features = YakuChecker._decomposition_features(decompositions)
+        mask = tile_mask(YakuChecker._complete_hand_tiles(hand, winning_tile))
+        return YakuChecker._is_honroutou(hand, winning_tile, mask, features)
 
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            if all(YakuChecker._is_triplet_meld(meld) for meld in melds):
-                return True
-        return False
+    @staticmethod
+    def _is_honroutou(
+        hand: Hand, winning_tile: Tile, mask: int, features: Dict[str, bool]
+    ) -> bool:
+        if mask & ~TERMINAL_HONOR_MASK:
+            return False
+        return features["all_triplets"] or YakuChecker._check_chiitoitsu(
+            hand, winning_tile
+        )
 
     @staticmethod
     def _check_shousangen(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, pair_tile in YakuChecker._standard_decompositions(hand, winning_tile):
-            if pair_tile.suit != Suit.DRAGON:
-                continue
-            dragon_triplets = 0
-            for meld in melds:
-                if len(meld) >= 3 and meld[0] == meld[1] == meld[2] and meld[0].suit == Suit.DRAGON:
-                    dragon_triplets += 1
-            if dragon_triplets == 2:
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["shousangen"]
 
     @staticmethod
     def _check_daisangen(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            dragon_triplets = 0
-            for meld in melds:
-                if len(meld) >= 3 and meld[0] == meld[1] == meld[2] and meld[0].suit == Suit.DRAGON:
-                    dragon_triplets += 1
-            if dragon_triplets == 3:
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["daisangen"]
 
     @staticmethod
     def _check_suuankou(hand: Hand, winning_tile: Tile, is_tsumo: bool) -> bool:
@@ -775,7 +832,9 @@ class YakuChecker:
         if not YakuChecker._check_suuankou(hand, winning_tile, is_tsumo):
             return False
 
-        for melds, pair_tile in YakuChecker._standard_decompositions(hand, winning_tile):
+        for melds, pair_tile in YakuChecker._standard_decompositions(
+            hand, winning_tile
+        ):
             if pair_tile != winning_tile:
                 continue
 
@@ -804,30 +863,19 @@ class YakuChecker:
 
     @staticmethod
     def _check_suukantsu(hand: Hand) -> bool:
-        return sum(1 for meld in hand.melds if meld.is_kan()) == 4
+        return hand.kan_count == 4
 
     @staticmethod
-    def _check_tsuuiisou(hand: Hand, winning_tile: Tile) -> bool:
-        tiles = YakuChecker._complete_hand_tiles(hand, winning_tile)
-        return all(tile.is_honor() for tile in tiles)
+    def _check_tsuuiisou(mask: int) -> bool:
+        return (mask & ~HONOR_MASK) == 0
 
     @staticmethod
-    def _check_chinroutou(hand: Hand, winning_tile: Tile) -> bool:
-        tiles = YakuChecker._complete_hand_tiles(hand, winning_tile)
-        return all(tile.is_terminal() for tile in tiles)
+    def _check_chinroutou(mask: int) -> bool:
+        return (mask & ~TERMINAL_MASK) == 0
 
     @staticmethod
-    def _check_ryuuiisou(hand: Hand, winning_tile: Tile) -> bool:
-        green_tiles = {
-            Tile(Suit.SOUZU, 2),
-            Tile(Suit.SOUZU, 3),
-            Tile(Suit.SOUZU, 4),
-            Tile(Suit.SOUZU, 6),
-            Tile(Suit.SOUZU, 8),
-            Tile(Suit.DRAGON, dragon=Dragon.GREEN),
-        }
-        tiles = YakuChecker._complete_hand_tiles(hand, winning_tile)
-        return all(tile in green_tiles for tile in tiles)
+    def _check_ryuuiisou(mask: int) -> bool:
+        return (mask & ~_GREEN_MASK) == 0
 
     @staticmethod
     def _check_chuuren_poutou(hand: Hand, winning_tile: Tile) -> bool:
@@ -836,19 +884,14 @@ class YakuChecker:
         tiles = YakuChecker._complete_hand_tiles(hand, winning_tile)
         if len(tiles) != 14:
             return False
-        if any(tile.is_honor() for tile in tiles):
-            return False
-        suits = {tile.suit for tile in tiles}
-        if len(suits) != 1:
-            return False
-        counts = {i: 0 for i in range(1, 10)}
-        for tile in tiles:
-            counts[tile.value] += 1
-        required = {1: 3, 9: 3, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1}
-        if any(counts[num] < req for num, req in required.items()):
-            return False
-        extra = sum(counts.values()) - sum(required.values())
-        return extra == 1
+        counts = tile_counts(tiles)
+        for start in (0, 9, 18):
+            suit_counts = counts[start : start + 9]
+            if sum(suit_counts) == 14:
+                return all(
+                    have >= need for have, need in zip(suit_counts, _CHUUREN_COUNTS)
+                )
+        return False
 
     @staticmethod
     def _check_junsei_chuuren_poutou(hand: Hand, winning_tile: Tile) -> bool:
@@ -864,38 +907,16 @@ class YakuChecker:
 
         if len(before_tiles) != 13:
             return False
-        if any(tile.is_honor() for tile in before_tiles):
-            return False
 
-        suits = {tile.suit for tile in before_tiles}
-        if len(suits) != 1:
-            return False
-
-        counts = {i: 0 for i in range(1, 10)}
-        for tile in before_tiles:
-            counts[tile.value] += 1
-
-        required = {1: 3, 9: 3, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1}
-        return all(counts[num] == req for num, req in required.items())
+        counts = tile_counts(before_tiles)
+        return any(counts[start : start + 9] == _CHUUREN_COUNTS for start in (0, 9, 18))
 
     @staticmethod
     def _check_shousuushii(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, pair_tile in YakuChecker._standard_decompositions(hand, winning_tile):
-            wind_triplets = 0
-            for meld in melds:
-                if len(meld) >= 3 and meld[0] == meld[1] == meld[2] and meld[0].suit == Suit.WIND:
-                    wind_triplets += 1
-            if wind_triplets == 3 and pair_tile.suit == Suit.WIND:
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["shousuushii"]
 
     @staticmethod
     def _check_daisuushii(hand: Hand, winning_tile: Tile) -> bool:
-        for melds, _ in YakuChecker._standard_decompositions(hand, winning_tile):
-            wind_triplets = 0
-            for meld in melds:
-                if len(meld) >= 3 and meld[0] == meld[1] == meld[2] and meld[0].suit == Suit.WIND:
-                    wind_triplets += 1
-            if wind_triplets == 4:
-                return True
-        return False
+        decompositions = YakuChecker._standard_decompositions(hand, winning_tile)
+        return YakuChecker._decomposition_features(decompositions)["daisuushii"]
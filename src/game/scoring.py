@@ -1,8 +1,21 @@
 from typing import Dict, List, Optional, Tuple
 
-from game.rules import Yaku
+from game.decomposition import (
+    DRAGON_MASK,
+    TILE_KINDS,
+    WIND_BITS,
+    meld_tiles,
+    standard_decompositions,
+    tile_counts,
+)
 from game.hand import Hand
-from tiles.tile import Suit, Tile, Wind
+from game.rules import Yaku
+from tiles.tile import Tile, Wind
+from utils.cache import BoundedCache
+
+# calculate_fu results for standard hands keyed by hand fingerprint and win
+# context.
+_fu_cache: BoundedCache[tuple, int] = BoundedCache()
 
 
 class Scoring:
@@ -58,12 +71,13 @@ class Scoring:
         # Calculate payments
         payments = {}
         if is_tsumo:
+            # The dealer's share of a tsumo is the same whoever wins; round
+            # it once and add honba after rounding.
+            dealer_payment = Scoring._round_up_100(base_points * 2) + honba * 100
             if is_dealer:
-                payment_per_player = Scoring._round_up_100(base_points * 2) + honba * 100
-                payments = {"all": payment_per_player}
-                final_score = payment_per_player * 3
+                payments = {"all": dealer_payment}
+                final_score = dealer_payment * 3
             else:
-                dealer_payment = Scoring._round_up_100(base_points * 2) + honba * 100
                 non_dealer_payment = Scoring._round_up_100(base_points) + honba * 100
                 payments = {
                     "dealer": dealer_payment,
@@ -92,9 +106,36 @@ class Scoring:
             return 0
         if "Chiitoitsu" in yaku_names:
             return 25
-        if "Pinfu" in yaku_names and is_tsumo:
+        is_pinfu = "Pinfu" in yaku_names
+        if is_pinfu and is_tsumo:
             return 20
 
+        key = (
+            hand.fingerprint(),
+            winning_tile.index,
+            is_tsumo,
+            seat_wind,
+            round_wind,
+            is_pinfu,
+        )
+        fu = _fu_cache.get(key)
+        if fu is None:
+            fu = Scoring._standard_hand_fu(
+                hand, winning_tile, is_tsumo, seat_wind, round_wind, is_pinfu
+            )
+            _fu_cache.put(key, fu)
+        return fu
+
+    @staticmethod
+    def _standard_hand_fu(
+        hand: Hand,
+        winning_tile: Tile,
+        is_tsumo: bool,
+        seat_wind: Wind,
+        round_wind: Wind,
+        is_pinfu: bool,
+    ) -> int:
+        """Calculate fu for a standard hand from its best decomposition."""
         tiles = hand.concealed_tiles[:]
         if len(tiles) == 13:
             tiles.append(winning_tile)
@@ -104,7 +145,7 @@ class Scoring:
             return 30
 
         base_fu = 20
-        if is_tsumo and "Pinfu" not in yaku_names:
+        if is_tsumo and not is_pinfu:
             base_fu += 2
         elif hand.is_closed():
             base_fu += 10
@@ -119,7 +160,7 @@ class Scoring:
             fu += Scoring._pair_fu(pair_tile, seat_wind, round_wind)
             fu += Scoring._meld_fu_total_with_win(melds, is_tsumo, winning_tile)
 
-            if "Pinfu" not in yaku_names:
+            if not is_pinfu:
                 fu += Scoring._wait_fu(pair_tile, melds, winning_tile)
 
             fu = Scoring._round_up_10(fu)
@@ -132,19 +173,12 @@ class Scoring:
     @staticmethod
     def _calculate_base_points(fu: int, han: int) -> int:
         """Calculate base points with limit hands."""
-        if han >= 13:
-            return Scoring.LIMIT_BASE_POINTS["yakuman"]
-        if han >= 11:
-            return Scoring.LIMIT_BASE_POINTS["sanbaiman"]
-        if han >= 8:
-            return Scoring.LIMIT_BASE_POINTS["baiman"]
-        if han >= 6:
-            return Scoring.LIMIT_BASE_POINTS["haneman"]
-
-        base = fu * (2 ** (han + 2))
-        if han >= 5 or base >= Scoring.LIMIT_BASE_POINTS["mangan"]:
-            return Scoring.LIMIT_BASE_POINTS["mangan"]
+        if han >= 5:
+            return _LIMIT_BASE_POINTS_BY_HAN[min(han, 13)]
 
+        base = _BASE_POINTS.get((han, fu))
+        if base is None:
+            base = min(fu << (han + 2), Scoring.LIMIT_BASE_POINTS["mangan"])
         return base
 
     @staticmethod
@@ -165,13 +199,7 @@ class Scoring:
         if not is_triplet:
             return 0
 
-        is_terminal_or_honor = first_tile.is_terminal_or_honor()
-        if len(meld_tiles) == 3:
-            base = 2 if is_open else 4
-        else:
-            base = 8 if is_open else 16
-
-        return base * (2 if is_terminal_or_honor else 1)
+        return _TRIPLET_FU[len(meld_tiles), is_open, first_tile.is_terminal_or_honor()]
 
     @staticmethod
     def _meld_fu_total(melds: List[List[Tile]], is_open: bool) -> int:
@@ -181,18 +209,12 @@ class Scoring:
     def _meld_fu_total_with_win(
         melds: List[List[Tile]], is_tsumo: bool, winning_tile: Tile
     ) -> int:
-        total = 0
-        for meld in melds:
-            is_open = False
-            if (
-                not is_tsumo
-                and len(meld) in (3, 4)
-                and all(tile == meld[0] for tile in meld)
-                and winning_tile in meld
-            ):
-                is_open = True
-            total += Scoring._meld_fu(meld, is_open=is_open)
-        return total
+        # A triplet completed by ron counts as open; _meld_fu already scores
+        # sequences as zero, so only the win condition is checked here.
+        return sum(
+            Scoring._meld_fu(meld, is_open=not is_tsumo and winning_tile in meld)
+            for meld in melds
+        )
 
     @staticmethod
     def _count_yakuman(yaku_list: List[Yaku]) -> int:
@@ -207,14 +229,11 @@ class Scoring:
 
     @staticmethod
     def _pair_fu(pair_tile: Tile, seat_wind: Wind, round_wind: Wind) -> int:
-        fu = 0
-        if pair_tile.suit == Suit.DRAGON:
+        # A double-wind pair counts once for the seat and once for the round.
+        bit = 1 << pair_tile.index
+        fu = 2 if bit & (DRAGON_MASK | WIND_BITS[seat_wind]) else 0
+        if bit & WIND_BITS[round_wind]:
             fu += 2
-        elif pair_tile.suit == Suit.WIND:
-            if pair_tile.wind == seat_wind:
-                fu += 2
-            if pair_tile.wind == round_wind:
-                fu += 2
         return fu
 
     @staticmethod
@@ -230,19 +249,18 @@ class Scoring:
                 continue
             if len(meld) != 3:
                 continue
-            if all(tile == meld[0] for tile in meld):
+            # Decomposed melds are canonical: sequences are already ascending.
+            low, middle, high = meld
+            if low == middle:
                 continue
 
-            seq = sorted(meld, key=lambda t: t.value or 0)
-            if winning_tile == seq[1]:
+            if winning_tile == middle:
                 wait_fu = max(wait_fu, 2)
                 continue
 
-            low = seq[0].value
-            high = seq[2].value
-            if low == 1 and winning_tile == seq[2]:
+            if low.value == 1 and winning_tile == high:
                 wait_fu = max(wait_fu, 2)
-            elif high == 9 and winning_tile == seq[0]:
+            elif high.value == 9 and winning_tile == low:
                 wait_fu = max(wait_fu, 2)
 
         return wait_fu
@@ -254,45 +272,36 @@ class Scoring:
         if len(tiles) != 14:
             return []
 
-        results: List[Tuple[List[List[Tile]], Tile]] = []
-        for pair_tile in set(tiles):
-            if tiles.count(pair_tile) < 2:
-                continue
-
-            remaining = tiles[:]
-            remaining.remove(pair_tile)
-            remaining.remove(pair_tile)
-
-            for melds in Scoring._extract_melds(remaining):
-                results.append((melds, pair_tile))
-
-        return results
-
-    @staticmethod
-    def _extract_melds(tiles: List[Tile]) -> List[List[List[Tile]]]:
-        if not tiles:
-            return [[]]
-
-        tiles_sorted = sorted(tiles, key=lambda t: (t.suit.value, t.value or 0))
-        first = tiles_sorted[0]
-        results: List[List[List[Tile]]] = []
-
-        if tiles_sorted.count(first) >= 3:
-            remaining = tiles_sorted[:]
-            for _ in range(3):
-                remaining.remove(first)
-            for melds in Scoring._extract_melds(remaining):
-                results.append([[first, first, first]] + melds)
-
-        if first.suit in (Suit.SOUZU, Suit.PINZU, Suit.MANZU) and first.value and first.value <= 7:
-            tile2 = Tile(first.suit, first.value + 1)
-            tile3 = Tile(first.suit, first.value + 2)
-            if tile2 in tiles_sorted and tile3 in tiles_sorted:
-                remaining = tiles_sorted[:]
-                remaining.remove(first)
-                remaining.remove(tile2)
-                remaining.remove(tile3)
-                for melds in Scoring._extract_melds(remaining):
-                    results.append([[first, tile2, tile3]] + melds)
-
-        return results
+        return [
+            ([meld_tiles(meld) for meld in melds], TILE_KINDS[pair])
+            for melds, pair in standard_decompositions(tile_counts(tiles))
+        ]
+
+
+# Fu of a triplet or quad keyed by (size, is_open, is_terminal_or_honor)
+_TRIPLET_FU: Dict[Tuple[int, bool, bool], int] = {
+    (size, is_open, outside): (2 if size == 3 else 8)
+    * (1 if is_open else 2)
+    * (2 if outside else 1)
+    for size in (3, 4)
+    for is_open in (False, True)
+    for outside in (False, True)
+}
+
+# Base points below the limit hands for every (han, fu) a scored hand can
+# reach, capped at mangan.
+_BASE_POINTS: Dict[Tuple[int, int], int] = {
+    (han, fu): min(fu << (han + 2), Scoring.LIMIT_BASE_POINTS["mangan"])
+    for han in range(1, 5)
+    for fu in (20, 25, 30, 40, 50, 60, 70, 80, 90, 100, 110)
+}
+
+# Limit-hand base points indexed by han (5-13); 13 and above is yakuman.
+_LIMIT_BASE_POINTS_BY_HAN: Tuple[int, ...] = (0,) * 5 + tuple(
+    Scoring.LIMIT_BASE_POINTS[limit]
+    for limit in ("mangan",)
+    + ("haneman",) * 2
+    + ("baiman",) * 3
+    + ("sanbaiman",) * 2
+    + ("yakuman",)
+)
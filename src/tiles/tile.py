@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class Suit(Enum):
@@ -24,64 +24,159 @@ class Dragon(Enum):
     WHITE = "white"
 
 
-@dataclass(frozen=True)
+# Tile kinds are numbered 0-33: manzu 0-8, pinzu 9-17, souzu 18-26,
+# winds 27-30 (E, S, W, N) and dragons 31-33 (white, green, red).
+_SUIT_OFFSETS = {Suit.MANZU: 0, Suit.PINZU: 9, Suit.SOUZU: 18}
+_HONOR_INDICES = {
+    Wind.EAST: 27,
+    Wind.SOUTH: 28,
+    Wind.WEST: 29,
+    Wind.NORTH: 30,
+    Dragon.WHITE: 31,
+    Dragon.GREEN: 32,
+    Dragon.RED: 33,
+}
+
+_INTERNED: Dict[tuple, "Tile"] = {}
+
+
 class Tile:
+    """An immutable tile.
+
+    Tiles are interned: constructing the same tile twice returns the same
+    instance. Equality and hashing ignore ``is_red``, so a red five equals a
+    plain five.
+    """
+
+    __slots__ = (
+        "suit",
+        "value",
+        "wind",
+        "dragon",
+        "is_red",
+        "_index",
+        "_is_terminal",
+        "_is_honor",
+        "_is_terminal_or_honor",
+        "_str",
+    )
+
     suit: Suit
-    value: Optional[int] = None
-    wind: Optional[Wind] = None
-    dragon: Optional[Dragon] = None
-    is_red: bool = False
-
-    def __post_init__(self):
-        if self.suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            if not (1 <= self.value <= 9):
+    value: Optional[int]
+    wind: Optional[Wind]
+    dragon: Optional[Dragon]
+    is_red: bool
+    _index: int
+    _is_terminal: bool
+    _is_honor: bool
+    _is_terminal_or_honor: bool
+    _str: str
+
+    def __new__(
+        cls,
+        suit: Suit,
+        value: Optional[int] = None,
+        wind: Optional[Wind] = None,
+        dragon: Optional[Dragon] = None,
+        is_red: bool = False,
+    ) -> "Tile":
+        key = (suit, value, wind, dragon, is_red)
+        tile = _INTERNED.get(key)
+        if tile is not None:
+            return tile
+
+        if suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
+            if not (1 <= value <= 9):
                 raise ValueError("Number tiles must have value 1-9")
-        elif self.suit == Suit.WIND:
-            if not self.wind:
+            index = _SUIT_OFFSETS[suit] + value - 1
+            color = "r" if is_red else ""
+            text = f"{value}{color}{suit.value}"
+        elif suit == Suit.WIND:
+            if not wind:
                 raise ValueError("Wind tiles must specify wind")
-        elif self.suit == Suit.DRAGON:
-            if not self.dragon:
+            index = _HONOR_INDICES[wind]
+            text = wind.value
+        elif suit == Suit.DRAGON:
+            if not dragon:
                 raise ValueError("Dragon tiles must specify dragon")
+            index = _HONOR_INDICES[dragon]
+            text = dragon.value
+        else:
+            raise ValueError(f"Unknown suit: {suit!r}")
+
+        # Classification never changes, so work it out once per tile
+        is_terminal = value in (1, 9)
+        is_honor = index >= 27
+
+        tile = object.__new__(cls)
+        for name, field_value in (
+            ("suit", suit),
+            ("value", value),
+            ("wind", wind),
+            ("dragon", dragon),
+            ("is_red", is_red),
+            ("_index", index),
+            ("_is_terminal", is_terminal),
+            ("_is_honor", is_honor),
+            ("_is_terminal_or_honor", is_terminal or is_honor),
+            ("_str", text),
+        ):
+            object.__setattr__(tile, name, field_value)
+        _INTERNED[key] = tile
+        return tile
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (Tile, (self.suit, self.value, self.wind, self.dragon, self.is_red))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return (
+            f"Tile(suit={self.suit!r}, value={self.value!r}, wind={self.wind!r}, "
+            f"dragon={self.dragon!r}, is_red={self.is_red!r})"
+        )
+
+    @property
+    def index(self) -> int:
+        """Index of the tile kind (0-33), ignoring red fives"""
+        return self._index
 
     def is_terminal(self) -> bool:
         """Check if tile is 1 or 9"""
-        return self.value in [1, 9] if self.value else False
+        return self._is_terminal
 
     def is_honor(self) -> bool:
         """Check if tile is wind or dragon"""
-        return self.suit in [Suit.WIND, Suit.DRAGON]
+        return self._is_honor
 
     def is_terminal_or_honor(self) -> bool:
         """Check if tile is terminal (1/9) or honor"""
-        return self.is_terminal() or self.is_honor()
+        return self._is_terminal_or_honor
 
     def next_tile(self) -> "Tile":
         """Get next tile for dora calculation"""
-        if self.suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            next_val = 1 if self.value == 9 else self.value + 1
-            return Tile(self.suit, next_val)
-        elif self.suit == Suit.WIND:
-            wind_cycle = [Wind.EAST, Wind.SOUTH, Wind.WEST, Wind.NORTH]
-            current_idx = wind_cycle.index(self.wind)
-            next_wind = wind_cycle[(current_idx + 1) % 4]
-            return Tile(Suit.WIND, wind=next_wind)
-        elif self.suit == Suit.DRAGON:
-            dragon_cycle = [Dragon.GREEN, Dragon.RED, Dragon.WHITE]
-            current_idx = dragon_cycle.index(self.dragon)
-            next_dragon = dragon_cycle[(current_idx + 1) % 3]
-            return Tile(Suit.DRAGON, dragon=next_dragon)
+        return TILE_KINDS[_NEXT_INDEX[self._index]]
 
     def __str__(self):
-        if self.suit in [Suit.SOUZU, Suit.PINZU, Suit.MANZU]:
-            color = "r" if self.is_red else ""
-            return f"{self.value}{color}{self.suit.value}"
-        elif self.suit == Suit.WIND:
-            return self.wind.value
-        elif self.suit == Suit.DRAGON:
-            return self.dragon.value
+        # Built once in __new__; serialization calls this for every tile
+        return self._str
 
     def __eq__(self, other):
         """Check if two tiles are equal based on their properties"""
+        if self is other:
+            return True
+        if isinstance(other, Tile):
+            return self._index == other._index
         if not hasattr(other, "suit"):
             return False
         return (
@@ -92,4 +187,26 @@ class Tile:
         )
 
     def __hash__(self):
-        return hash((self.suit, self.value, self.wind, self.dragon))
+        # Consistent with __eq__, which compares kinds by index
+        return self._index
+
+
+# Canonical (non-red) tile for each kind, ordered by Tile.index.
+TILE_KINDS: Tuple[Tile, ...] = tuple(
+    [
+        Tile(suit, value)
+        for suit in (Suit.MANZU, Suit.PINZU, Suit.SOUZU)
+        for value in range(1, 10)
+    ]
+    + [Tile(Suit.WIND, wind=wind) for wind in Wind]
+    + [
+        Tile(Suit.DRAGON, dragon=dragon)
+        for dragon in (Dragon.WHITE, Dragon.GREEN, Dragon.RED)
+    ]
+)
+
+# Index of the dora indicated by each tile kind: numbers wrap 9 -> 1, winds
+# cycle E -> S -> W -> N and dragons white -> green -> red.
+_NEXT_INDEX: Tuple[int, ...] = tuple(
+    (i // 9) * 9 + (i % 9 + 1) % 9 for i in range(27)
+) + (28, 29, 30, 27, 32, 33, 31)
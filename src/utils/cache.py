@@ -0,0 +1,34 @@
+"""
+Bounded memo shared by the hand evaluation caches
+"""
+
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BoundedCache(Generic[K, V]):
+    """Insertion-ordered memo; the oldest entry is evicted once it is full."""
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._entries: Dict[K, V] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """Cached value for ``key``, or None."""
+        return self._entries.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value``, evicting the oldest entry if the cache is full."""
+        entries = self._entries
+        if key not in entries and len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,7 +4,7 @@ Constants and utility functions for Riichi Mahjong
 
 from typing import Dict, List
 
-from tiles.tile import Dragon, Suit, Tile, Wind
+from tiles.tile import TILE_KINDS, Dragon, Suit, Tile, Wind
 
 # Scoring constants
 STARTING_POINTS = 25000
@@ -76,10 +76,16 @@ TILE_UNICODE = {
 }
 
 
+# Unicode glyph for each tile kind, ordered by Tile.index
+_UNICODE_BY_INDEX = tuple(TILE_UNICODE[str(tile)] for tile in TILE_KINDS)
+
+
 def get_tile_unicode(tile: Tile) -> str:
     """Get Unicode representation of a tile"""
-    tile_str = str(tile)
-    return TILE_UNICODE.get(tile_str, tile_str)
+    if tile.is_red:
+        # Red fives have no glyph of their own and display as text
+        return str(tile)
+    return _UNICODE_BY_INDEX[tile.index]
 
 
 def format_hand_display(tiles: List[Tile]) -> str:
@@ -0,0 +1,12 @@
+import eventlet  # isort: skip
+
+eventlet.monkey_patch()
+
+# Entry point for the Riichi Mahjong web server. eventlet has to patch the
+# standard library before Flask, Socket.IO or threading are imported, so the
+# patch comes first here and web_server keeps no import-time side effects.
+
+from web_server import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -4,83 +4,244 @@ Web server for Riichi Mahjong Engine
 Provides REST API and WebSocket interface
 """
 
-import json
-import uuid
-from typing import Any, Dict
-
-from flask import Flask, jsonify, request
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from flask import Blueprint, Flask, current_app, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit, join_room, leave_room
 
 from game.engine import MahjongEngine
 
-app = Flask(__name__)
-app.config["SECRET_KEY"] = "mahjong-secret-key"
-socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Store active games
-games: Dict[str, MahjongEngine] = {}
-player_sessions: Dict[str, str] = {}  # session_id -> game_id
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class OrjsonSocketJSON:
+    """json-module stand-in so Socket.IO packets are encoded by orjson"""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+# Games idle for longer than GAME_TTL_SECONDS, or beyond MAX_GAMES, are dropped
+MAX_GAMES = 10_000
+GAME_TTL_SECONDS = 3600
+# game_update events are coalesced per room and flushed once per tick
+UPDATE_INTERVAL_SECONDS = 0.016
+
+
+class GameStore:
+    """Active games of one app, plus cached views of them.
+
+    Games are kept in least-recently-used order. The serialized state and
+    per-seat valid actions are cached until execute_action changes the game.
+    Handlers run on eventlet green threads and never yield while touching the
+    store, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        max_games: int = MAX_GAMES,
+        ttl_seconds: float = GAME_TTL_SECONDS,
+        on_expire: Optional[Callable[[str], None]] = None,
+    ):
+        self.max_games = max_games
+        self.ttl_seconds = ttl_seconds
+        self.on_expire = on_expire
+        self.games: "OrderedDict[str, MahjongEngine]" = OrderedDict()
+        self.player_sessions: Dict[str, str] = {}  # session_id -> game_id
+        self.pending_updates: Dict[str, Dict[str, Any]] = {}  # latest per game
+        self._last_used: Dict[str, float] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._actions: Dict[str, Dict[int, List[str]]] = {}
+
+    def add(self, game_id: str, game: MahjongEngine) -> None:
+        self.games[game_id] = game
+        self._last_used[game_id] = time.monotonic()
+        self.expire()
+
+    def get(self, game_id: str) -> Optional[MahjongEngine]:
+        """Look up a live game and mark it as recently used"""
+        self.expire()
+        game = self.games.get(game_id)
+        if game is not None:
+            self.games.move_to_end(game_id)
+            self._last_used[game_id] = time.monotonic()
+        return game
+
+    def expire(self) -> None:
+        """Drop idle games and the oldest games over the size limit"""
+        now = time.monotonic()
+        while self.games:
+            game_id = next(iter(self.games))
+            idle = now - self._last_used[game_id]
+            if len(self.games) <= self.max_games and idle < self.ttl_seconds:
+                break
+            del self.games[game_id]
+            del self._last_used[game_id]
+            self.invalidate(game_id)
+            self.pending_updates.pop(game_id, None)
+            for sid, gid in list(self.player_sessions.items()):
+                if gid == game_id:
+                    del self.player_sessions[sid]
+            if self.on_expire is not None:
+                self.on_expire(game_id)
+
+    def invalidate(self, game_id: str) -> None:
+        """Forget cached views of a game after it changes"""
+        self._states.pop(game_id, None)
+        self._actions.pop(game_id, None)
+
+    def queue_update(self, game_id: str, update: Dict[str, Any]) -> bool:
+        """Replace the game's unsent update; True if no flush is pending yet"""
+        first = not self.pending_updates
+        self.pending_updates[game_id] = update
+        return first
+
+    def take_updates(self) -> Dict[str, Dict[str, Any]]:
+        updates, self.pending_updates = self.pending_updates, {}
+        return updates
+
+    def state(self, game_id: str) -> Dict[str, Any]:
+        """Return the game's state, serializing it only after a change"""
+        state = self._states.get(game_id)
+        if state is None:
+            state = self._states[game_id] = self.games[game_id].get_game_state()
+        return state
+
+    def valid_actions(self, game_id: str, player_index: int) -> List[str]:
+        seats = self._actions.setdefault(game_id, {})
+        actions = seats.get(player_index)
+        if actions is None:
+            game = self.games[game_id]
+            actions = seats[player_index] = game.get_valid_actions(player_index)
+        return actions
+
+
+api = Blueprint("api", __name__)
+
+
+def get_store() -> GameStore:
+    return current_app.extensions["game_store"]
+
+
+def get_socketio() -> SocketIO:
+    return current_app.extensions["socketio"]
+
+
+def flush_updates(socketio: SocketIO, store: GameStore) -> None:
+    """Send the latest queued game_update of each room after one tick"""
+    socketio.sleep(UPDATE_INTERVAL_SECONDS)
+    for game_id, update in store.take_updates().items():
+        socketio.emit("game_update", update, room=game_id)
+
+
+def create_app(async_mode: Optional[str] = None) -> Flask:
+    """Create the Flask app with its own game store and Socket.IO server
+
+    ``async_mode`` is passed to Flask-SocketIO; None lets it pick the best
+    installed backend.
+    """
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.config["SECRET_KEY"] = "mahjong-secret-key"
+    app.config["MAX_CONTENT_LENGTH"] = 64 * 1024  # request bodies are tiny
+    socketio = SocketIO(
+        app, async_mode=async_mode, cors_allowed_origins="*", json=OrjsonSocketJSON
+    )
+    app.extensions["game_store"] = GameStore(
+        on_expire=lambda game_id: socketio.emit(
+            "game_expired", {"game_id": game_id}, room=game_id
+        )
+    )
+    app.register_blueprint(api)
+    socketio.on_event("join_game", on_join_game)
+    socketio.on_event("leave_game", on_leave_game)
+    socketio.on_event("disconnect", on_disconnect)
+    return app
 
 
-@app.route("/api/create_game", methods=["POST"])
+@api.route("/api/create_game", methods=["POST"])
 def create_game():
     """Create a new game"""
-    data = request.json
+    data = request.get_json(cache=True, silent=True) or {}
     player_names = data.get("players", ["Player 1", "Player 2", "Player 3", "Player 4"])
 
     if len(player_names) != 4:
         return jsonify({"error": "Exactly 4 players required"}), 400
 
-    game_id = str(uuid.uuid4())
+    game_id = secrets.token_urlsafe(12)  # 96 random bits, 16 URL-safe chars
     try:
-        game = MahjongEngine(player_names)
-        games[game_id] = game
+        store = get_store()
+        store.add(game_id, MahjongEngine(player_names))
 
-        return jsonify({"game_id": game_id, "state": game.get_game_state()})
+        return jsonify({"game_id": game_id, "state": store.state(game_id)})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/game/<game_id>/state", methods=["GET"])
+@api.route("/api/game/<game_id>/state", methods=["GET"])
 def get_game_state(game_id: str):
     """Get current game state"""
-    if game_id not in games:
+    store = get_store()
+    if store.get(game_id) is None:
         return jsonify({"error": "Game not found"}), 404
 
-    game = games[game_id]
-    return jsonify(game.get_game_state())
+    return jsonify(store.state(game_id))
 
 
-@app.route("/api/game/<game_id>/player/<int:player_index>/hand", methods=["GET"])
+@api.route(
+    "/api/game/<game_id>/player/<int(min=0,max=3):player_index>/hand",
+    methods=["GET"],
+)
 def get_player_hand(game_id: str, player_index: int):
     """Get player's hand"""
-    if game_id not in games:
+    game = get_store().get(game_id)
+    if game is None:
         return jsonify({"error": "Game not found"}), 404
 
-    if not (0 <= player_index <= 3):
-        return jsonify({"error": "Invalid player index"}), 400
-
-    game = games[game_id]
     return jsonify(game.get_player_hand(player_index))
 
 
-@app.route("/api/game/<game_id>/player/<int:player_index>/actions", methods=["GET"])
+@api.route(
+    "/api/game/<game_id>/player/<int(min=0,max=3):player_index>/actions",
+    methods=["GET"],
+)
 def get_valid_actions(game_id: str, player_index: int):
     """Get valid actions for player"""
-    if game_id not in games:
+    store = get_store()
+    if store.get(game_id) is None:
         return jsonify({"error": "Game not found"}), 404
 
-    game = games[game_id]
-    return jsonify({"actions": game.get_valid_actions(player_index)})
+    return jsonify({"actions": store.valid_actions(game_id, player_index)})
 
 
-@app.route("/api/game/<game_id>/action", methods=["POST"])
+@api.route("/api/game/<game_id>/action", methods=["POST"])
 def execute_action(game_id: str):
     """Execute a game action"""
-    if game_id not in games:
+    store = get_store()
+    game = store.get(game_id)
+    if game is None:
         return jsonify({"error": "Game not found"}), 404
 
-    data = request.json
+    data = request.get_json(cache=True, silent=True) or {}
     player_index = data.get("player_index")
     action = data.get("action")
     kwargs = data.get("kwargs", {})
@@ -88,59 +249,70 @@ def execute_action(game_id: str):
     if player_index is None or action is None:
         return jsonify({"error": "Missing player_index or action"}), 400
 
-    game = games[game_id]
     result = game.execute_action(player_index, action, **kwargs)
+    store.invalidate(game_id)
 
-    # Emit update to all connected clients
-    socketio.emit(
-        "game_update",
-        {"game_id": game_id, "result": result, "state": game.get_game_state()},
-        room=game_id,
-    )
+    # Rapid actions on one game collapse into a single frame per tick; the
+    # flush runs on a green thread so the HTTP response does not wait for it
+    update = {"game_id": game_id, "result": result, "state": store.state(game_id)}
+    if store.queue_update(game_id, update):
+        socketio = get_socketio()
+        socketio.start_background_task(flush_updates, socketio, store)
 
     return jsonify(result)
 
 
-@socketio.on("join_game")
 def on_join_game(data):
     """Join a game room"""
     game_id = data["game_id"]
     player_index = data.get("player_index")
 
-    if game_id not in games:
+    store = get_store()
+    if store.get(game_id) is None:
         emit("error", {"message": "Game not found"})
         return
 
     join_room(game_id)
-    player_sessions[request.sid] = game_id
+    store.player_sessions[request.sid] = game_id
 
     emit(
         "joined_game",
         {
             "game_id": game_id,
             "player_index": player_index,
-            "state": games[game_id].get_game_state(),
+            "state": store.state(game_id),
         },
     )
 
 
-@socketio.on("leave_game")
 def on_leave_game():
     """Leave a game room"""
+    player_sessions = get_store().player_sessions
     if request.sid in player_sessions:
         game_id = player_sessions[request.sid]
         leave_room(game_id)
         del player_sessions[request.sid]
 
 
-@socketio.on("disconnect")
 def on_disconnect():
     """Handle client disconnect"""
+    player_sessions = get_store().player_sessions
     if request.sid in player_sessions:
         game_id = player_sessions[request.sid]
         leave_room(game_id)
         del player_sessions[request.sid]
 
 
-if __name__ == "__main__":
-    socketio.run(app, host="0.0.0.0", port=8080, debug=True)
+def main() -> None:
+    """Serve the app with Socket.IO on eventlet
+
+    Call this through web_launcher, which patches the standard library with
+    eventlet before this module (and Flask) is imported.
+    """
+    app = create_app(async_mode="eventlet")
+    app.extensions["socketio"].run(
+        app,
+        host="0.0.0.0",
+        port=8080,
+        debug=os.environ.get("FLASK_ENV") == "development",
+    )
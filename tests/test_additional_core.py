@@ -162,6 +162,27 @@ def test_wall_draw_and_dora_indicator():
     assert len(wall.dora_indicators) == initial_dora_count + 1
 
 
+def test_wall_dora_tiles_follow_new_indicators():
+    wall = Wall()
+    assert len(wall.get_dora_tiles()) == 1
+    assert len(wall.get_ura_dora_tiles()) == 1
+
+    wall.add_dora_indicator()
+    assert wall.get_dora_tiles() == [
+        indicator.next_tile() for indicator in wall.dora_indicators
+    ]
+    assert len(wall.get_ura_dora_tiles()) == 2
+
+
+def test_wall_dora_tiles_are_copies():
+    wall = Wall()
+    wall.get_dora_tiles().clear()
+    wall.get_ura_dora_tiles().clear()
+
+    assert len(wall.get_dora_tiles()) == 1
+    assert len(wall.get_ura_dora_tiles()) == 1
+
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Engine‑level logic (focused, monkey‑patched where needed)
 # ────────────────────────────────────────────────────────────────────────────────
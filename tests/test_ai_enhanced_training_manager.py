@@ -1,8 +1,11 @@
 import importlib.util
 import sys
 import types
+from collections import deque
 from pathlib import Path
 
+import pytest
+
 
 def _load_modules(monkeypatch):
     spec = importlib.util.spec_from_file_location("ai_config_under_test", "src/ai/config.py")
@@ -30,10 +33,12 @@ def _load_modules(monkeypatch):
     return mod, config_mod.TrainingConfig
 
 
-class DummyMemory(list):
-    def __init__(self, maxlen=None):
-        super().__init__()
-        self.maxlen = maxlen
+@pytest.fixture(scope="module")
+def loaded_modules():
+    # Load once per module; the sys.modules stubs are only needed while the
+    # module body runs, and per-test monkeypatches on it still auto-revert.
+    with pytest.MonkeyPatch.context() as mp:
+        return _load_modules(mp)
 
 
 class DummyPlayer:
@@ -42,13 +47,13 @@ class DummyPlayer:
         self.seat_wind = seat_wind
         self.learning_rate = learning_rate
         self.batch_size = 0
-        self.memory = DummyMemory(maxlen=1)
+        self.memory = deque(maxlen=1)
         self.epsilon = 0.5
         self.epsilon_min = 0.1
         self.epsilon_decay = 0.9
         self.target_update_freq = 1
         self.score = 25000
-        self.hand = type("H", (), {"concealed_tiles": []})()
+        self.hand = types.SimpleNamespace(concealed_tiles=[])
         self.is_dealer = False
         self.total_games = 0
         self.wins = 0
@@ -80,7 +85,7 @@ class DummyPlayer:
 
 class DummyLogger:
     def __init__(self, *args, **kwargs):
-        self.logger = type("L", (), {"info": lambda self, _: None})()
+        self.logger = types.SimpleNamespace(info=lambda _: None)
 
     def log_game_result(self, *a, **k):
         pass
@@ -100,7 +105,7 @@ class DummyAnalyzer:
         pass
 
     def plot_learning_curves(self, save_path):
-        Path(save_path).write_text("plot")
+        Path(save_path).write_bytes(b"plot")
 
     def generate_report(self):
         return "ok"
@@ -109,15 +114,20 @@ class DummyAnalyzer:
 class DummyGame:
     def __init__(self, names, *, ended=False, no_actions=False):
         self.players = [
-            type("P", (), {"score": 25000, "hand": type("H", (), {"concealed_tiles": []})(), "seat_wind": i, "is_dealer": i == 0})()
+            types.SimpleNamespace(
+                score=25000,
+                hand=types.SimpleNamespace(concealed_tiles=[]),
+                seat_wind=i,
+                is_dealer=i == 0,
+            )
             for i, _ in enumerate(names)
         ]
         self.current_player = 0
-        self.phase = type("Phase", (), {"value": "play"})()
+        self.phase = types.SimpleNamespace(value="play")
         self.last_discard = None
         self._ended = ended
         self._no_actions = no_actions
-        self.wall = type("W", (), {"tiles_remaining": lambda self: 7})()
+        self.wall = types.SimpleNamespace(tiles_remaining=lambda: 7)
 
     def get_game_state(self):
         return {"dummy": 1}
@@ -130,7 +140,7 @@ class DummyGame:
 
     def execute_action(self, idx, action, **kwargs):
         if self._ended:
-            self.phase = type("Phase", (), {"value": "ended"})()
+            self.phase = types.SimpleNamespace(value="ended")
             return {
                 "success": True,
                 "game_ended": True,
@@ -145,8 +155,8 @@ class DummyGame:
         self.current_player = (self.current_player + 1) % 4
 
 
-def test_enhanced_training_manager_logic(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_training_manager_logic(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
@@ -191,8 +201,8 @@ def test_enhanced_training_manager_logic(monkeypatch, tmp_path):
     assert (tmp_path / "final_training_report.txt").exists()
 
 
-def test_enhanced_training_manager_edge_paths(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_training_manager_edge_paths(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
@@ -224,8 +234,8 @@ class InvalidActionGame(DummyGame):
         return {"success": False, "game_ended": False, "message": "nope"}
 
 
-def test_enhanced_manager_additional_branches(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_manager_additional_branches(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
@@ -283,8 +293,8 @@ class PassGame(DummyGame):
         return {"success": False, "game_ended": False, "message": "x"}
 
 
-def test_enhanced_manager_turn_flow_branches(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_manager_turn_flow_branches(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
@@ -332,8 +342,8 @@ class ResponderActionGame(DummyGame):
         }
 
 
-def test_enhanced_manager_responder_branches(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_manager_responder_branches(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
@@ -375,8 +385,8 @@ class ResponderCallNoEndGame(DummyGame):
         return {"success": True, "game_ended": False, "message": "called"}
 
 
-def test_enhanced_manager_call_was_made_branch_and_default_should_advance(monkeypatch, tmp_path):
-    etm, TrainingConfig = _load_modules(monkeypatch)
+def test_enhanced_manager_call_was_made_branch_and_default_should_advance(monkeypatch, tmp_path, loaded_modules):
+    etm, TrainingConfig = loaded_modules
     monkeypatch.setattr(etm, "NeuralPlayer", DummyPlayer)
     monkeypatch.setattr(etm, "TrainingLogger", DummyLogger)
     monkeypatch.setattr(etm, "PerformanceAnalyzer", DummyAnalyzer)
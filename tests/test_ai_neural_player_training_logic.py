@@ -2,6 +2,8 @@ import importlib.util
 import sys
 import types
 
+import pytest
+
 
 def _load_neural_player_module(monkeypatch):
     dummy_nn = types.SimpleNamespace(
@@ -40,13 +42,19 @@ def _load_neural_player_module(monkeypatch):
     return mod.NeuralPlayer
 
 
-def _player_without_init(monkeypatch):
-    neural_cls = _load_neural_player_module(monkeypatch)
+@pytest.fixture(scope="module")
+def neural_cls():
+    # The stubs are only needed while the module body runs
+    with pytest.MonkeyPatch.context() as mp:
+        return _load_neural_player_module(mp)
+
+
+def _player_without_init(neural_cls):
     return neural_cls.__new__(neural_cls)
 
 
-def test_kan_kwargs_prefer_explicit_kan_lists(monkeypatch):
-    player = _player_without_init(monkeypatch)
+def test_kan_kwargs_prefer_explicit_kan_lists(neural_cls):
+    player = _player_without_init(neural_cls)
 
     hand = {
         "upgrade_kan_tiles": ["7sou"],
@@ -63,8 +71,8 @@ def test_kan_kwargs_prefer_explicit_kan_lists(monkeypatch):
     assert player._get_random_action_kwargs("kan", hand2) == {"tile": "3man"}
 
 
-def test_kan_kwargs_fallback_from_concealed_tiles_and_none_case(monkeypatch):
-    player = _player_without_init(monkeypatch)
+def test_kan_kwargs_fallback_from_concealed_tiles_and_none_case(neural_cls):
+    player = _player_without_init(neural_cls)
 
     fallback_hand = {"concealed_tiles": ["2pin", "2pin", "2pin", "2pin"]}
     assert player._get_kan_tile(fallback_hand) == "2pin"
@@ -73,8 +81,8 @@ def test_kan_kwargs_fallback_from_concealed_tiles_and_none_case(monkeypatch):
     assert player._get_kan_tile(no_kan_hand) is None
 
 
-def test_chii_sequence_picker_and_parser(monkeypatch):
-    player = _player_without_init(monkeypatch)
+def test_chii_sequence_picker_and_parser(neural_cls):
+    player = _player_without_init(neural_cls)
 
     hand = {
         "last_discard": "5sou",
@@ -2,6 +2,8 @@ import importlib.util
 import sys
 import types
 
+import pytest
+
 
 class DummyTrainer:
     def __init__(self, save_dir):
@@ -23,14 +25,22 @@ def load_train_module(factory):
     return module
 
 
-def test_train_cli_train_and_eval(monkeypatch):
+@pytest.fixture(scope="module")
+def train_ai():
+    # Load once; each test swaps in its own TrainingManager factory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "ai.training_manager", None)  # restored on exit
+        return load_train_module(DummyTrainer)
+
+
+def test_train_cli_train_and_eval(monkeypatch, train_ai):
     holder = {}
 
     def factory(save_dir):
         holder["trainer"] = DummyTrainer(save_dir)
         return holder["trainer"]
 
-    train_ai = load_train_module(factory)
+    monkeypatch.setattr(train_ai, "TrainingManager", factory)
     monkeypatch.setattr(
         sys,
         "argv",
@@ -42,14 +52,14 @@ def test_train_cli_train_and_eval(monkeypatch):
     assert trainer.calls[1] == ("eval", 3)
 
 
-def test_train_cli_eval_only(monkeypatch):
+def test_train_cli_eval_only(monkeypatch, train_ai):
     holder = {}
 
     def factory(save_dir):
         holder["trainer"] = DummyTrainer(save_dir)
         return holder["trainer"]
 
-    train_ai = load_train_module(factory)
+    monkeypatch.setattr(train_ai, "TrainingManager", factory)
     monkeypatch.setattr(sys, "argv", ["train_ai.py", "--eval-only", "--eval-games", "4"])
     train_ai.main()
     assert holder["trainer"].calls == [("eval", 4)]
@@ -4,24 +4,10 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
 
-def _load_training_manager(monkeypatch):
-    class Arr:
-        def __init__(self, data):
-            self._data = data
-
-        def __len__(self):
-            return len(self._data)
-
-        def __getitem__(self, key):
-            if isinstance(key, tuple):
-                rows, col = key
-                data = self._data[rows] if isinstance(rows, slice) else self._data
-                return [r[col] for r in data]
-            return self._data[key]
-
-    np_mod = types.SimpleNamespace(array=lambda x: Arr(x))
 
+def _load_training_manager(monkeypatch):
     class Ax:
         def plot(self, *a, **k):
             pass
@@ -52,7 +38,7 @@ def _load_training_manager(monkeypatch):
             pass
 
         def savefig(self, path):
-            Path(path).write_text("plot")
+            Path(path).write_bytes(b"plot")
 
         def close(self):
             pass
@@ -63,7 +49,6 @@ def _load_training_manager(monkeypatch):
         WEST = "west"
         NORTH = "north"
 
-    monkeypatch.setitem(sys.modules, "numpy", np_mod)
     monkeypatch.setitem(sys.modules, "matplotlib", types.SimpleNamespace(pyplot=Plt()))
     monkeypatch.setitem(sys.modules, "matplotlib.pyplot", Plt())
     monkeypatch.setitem(sys.modules, "ai.neural_player", types.SimpleNamespace(NeuralPlayer=object))
@@ -76,7 +61,26 @@ def _load_training_manager(monkeypatch):
     return module
 
 
+@pytest.fixture(scope="module")
+def tm():
+    # The stubs are only needed while the module body runs; per-test
+    # monkeypatches on the loaded module still auto-revert.
+    with pytest.MonkeyPatch.context() as mp:
+        return _load_training_manager(mp)
+
+
 class DummyPlayer:
+    # Fixed stats; the training manager only reads them
+    _STATS = {
+        "win_rate": 0.25,
+        "avg_recent_loss": 0.1,
+        "total_games": 1,
+        "wins": 0,
+        "epsilon": 0.1,
+        "memory_size": 1,
+        "training_steps": 1,
+    }
+
     def __init__(self, name, seat_wind, learning_rate=0.001):
         self.name = name
         self.seat_wind = seat_wind
@@ -86,12 +90,14 @@ class DummyPlayer:
         self.is_dealer = False
         self.rewards = []
         self.results = []
+        self.saved_paths = []
 
     def load_model(self, path):
         pass
 
     def save_model(self, path):
-        Path(path).write_text("model")
+        # No test reads the model files back, so skip the disk write
+        self.saved_paths.append(path)
 
     def choose_action(self, game_state, player_hand, valid_actions):
         return valid_actions[0], {}
@@ -103,29 +109,25 @@ class DummyPlayer:
         self.results.append((won, final_score))
 
     def get_stats(self):
-        return {
-            "win_rate": 0.25,
-            "avg_recent_loss": 0.1,
-            "total_games": 1,
-            "wins": 0,
-            "epsilon": 0.1,
-            "memory_size": 1,
-            "training_steps": 1,
-        }
+        return self._STATS
 
 
 class DummyGame:
     def __init__(self, names, *, game_ended=False, success=True, no_actions=False):
         self.players = [
-            type("P", (), {"score": 25000, "hand": object(), "seat_wind": i, "is_dealer": i == 0})()
+            types.SimpleNamespace(score=25000, hand=object(), seat_wind=i, is_dealer=i == 0)
             for i, _ in enumerate(names)
         ]
         self.current_player = 0
-        self.phase = type("Phase", (), {"value": "play"})()
+        self.phase = types.SimpleNamespace(value="play")
         self.last_discard = None
         self._game_ended = game_ended
-        self._success = success
         self._no_actions = no_actions
+        # Built once per game; the training manager only reads results
+        if game_ended:
+            self._result = {"success": success, "game_ended": True, "winner": 0}
+        else:
+            self._result = {"success": success, "game_ended": False}
 
     def get_game_state(self):
         return {"x": 1}
@@ -138,16 +140,14 @@ class DummyGame:
 
     def execute_action(self, idx, action, **kwargs):
         if self._game_ended:
-            self.phase = type("Phase", (), {"value": "ended"})()
-            return {"success": self._success, "game_ended": True, "winner": 0}
-        return {"success": self._success, "game_ended": False}
+            self.phase = types.SimpleNamespace(value="ended")
+        return self._result
 
     def advance_turn(self):
         self.current_player = (self.current_player + 1) % 4
 
 
-def test_training_manager_paths(monkeypatch, tmp_path):
-    tm = _load_training_manager(monkeypatch)
+def test_training_manager_paths(monkeypatch, tmp_path, tm):
     monkeypatch.setattr(tm, "NeuralPlayer", DummyPlayer)
     manager = tm.TrainingManager(save_dir=str(tmp_path))
 
@@ -158,7 +158,8 @@ def test_training_manager_paths(monkeypatch, tmp_path):
     manager.train_players(num_games=1, save_interval=1, learning_rate=0.3)
     assert players[0].hand is None  # independent from trainer-owned players
 
-    out = manager.play_training_game(DummyGame([p.name for p in manager.create_neural_players()], game_ended=True), manager.create_neural_players())
+    winning_players = manager.create_neural_players()
+    out = manager.play_training_game(DummyGame([p.name for p in winning_players], game_ended=True), winning_players)
     assert out["winner"] == 0
 
     no_action_players = manager.create_neural_players()
@@ -179,14 +180,13 @@ def test_training_manager_paths(monkeypatch, tmp_path):
     ps = manager.create_neural_players()
     manager.update_training_stats(ps, {"winner": 0})
     manager.save_training_stats()
-    payload = json.loads((tmp_path / "training_stats.json").read_text())
+    payload = json.loads((tmp_path / "training_stats.json").read_bytes())
     assert payload["games_played"] >= 1
 
     manager.plot_training_progress()
-    for _ in range(10):
-        manager.training_stats["win_rates"].append([0.2, 0.2, 0.2, 0.2])
-        manager.training_stats["avg_scores"].append([25000] * 4)
-        manager.training_stats["training_losses"].append([0.1] * 4)
+    manager.training_stats["win_rates"].extend([[0.2] * 4] * 10)
+    manager.training_stats["avg_scores"].extend([[25000] * 4] * 10)
+    manager.training_stats["training_losses"].extend([[0.1] * 4] * 10)
     manager.plot_training_progress()
     assert (tmp_path / "training_progress.png").exists()
 
@@ -201,12 +201,8 @@ class EndlessGame(DummyGame):
         super().__init__(names, game_ended=False, success=True, no_actions=False)
         self.last_discard = object()
 
-    def execute_action(self, idx, action, **kwargs):
-        return {"success": True, "game_ended": False}
-
 
-def test_training_manager_remaining_branches(monkeypatch, tmp_path):
-    tm = _load_training_manager(monkeypatch)
+def test_training_manager_remaining_branches(monkeypatch, tmp_path, tm):
     monkeypatch.setattr(tm, "NeuralPlayer", DummyPlayer)
     manager = tm.TrainingManager(save_dir=str(tmp_path))
     # Cover model loading branch
@@ -217,6 +213,7 @@ def test_training_manager_remaining_branches(monkeypatch, tmp_path):
     manager.train_players(num_games=1, save_interval=1, learning_rate=0.1)
 
     # Cover max-turn draw path
+    monkeypatch.setattr(tm, "MAX_TURNS_PER_GAME", 2)
     players = manager.create_neural_players()
     result = manager.play_training_game(EndlessGame([p.name for p in players]), players)
     assert result["game_ended_normally"] is False
@@ -236,8 +233,7 @@ class AdvanceTurnGame(DummyGame):
         return ["discard"] if self.calls == 1 else []
 
 
-def test_training_manager_advance_turn_branch(monkeypatch, tmp_path):
-    tm = _load_training_manager(monkeypatch)
+def test_training_manager_advance_turn_branch(monkeypatch, tmp_path, tm):
     monkeypatch.setattr(tm, "NeuralPlayer", DummyPlayer)
     m = tm.TrainingManager(save_dir=str(tmp_path))
     players = m.create_neural_players()
@@ -0,0 +1,25 @@
+from src.utils.cache import BoundedCache
+
+
+def test_bounded_cache_evicts_oldest_entry():
+    cache = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 3)  # overwriting does not evict
+    assert len(cache) == 2
+
+    cache.put("c", 4)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 4
+
+
+def test_bounded_cache_clear():
+    cache = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from src.game import decomposition
+from src.game.decomposition import (
+    SEQUENCE,
+    TILE_KINDS,
+    TRIPLET,
+    extract_melds,
+    is_standard_hand,
+    meld_tiles,
+    standard_decompositions,
+    tile_counts,
+)
+from tiles.tile import Dragon, Suit, Tile
+
+
+def test_tile_kinds_are_ordered_by_index():
+    assert len(TILE_KINDS) == 34
+    assert all(tile.index == i for i, tile in enumerate(TILE_KINDS))
+
+
+def test_triple_sequence_has_two_decompositions():
+    # 111222333m can be three triplets or three 1-2-3 sequences
+    counts = tile_counts([Tile(Suit.MANZU, v) for v in (1, 1, 1, 2, 2, 2, 3, 3, 3)])
+    results = extract_melds(counts)
+    assert sorted(results) == [
+        [(TRIPLET, 0), (TRIPLET, 1), (TRIPLET, 2)],
+        [(SEQUENCE, 0), (SEQUENCE, 0), (SEQUENCE, 0)],
+    ]
+    assert extract_melds(counts, allow_triplets=False) == [
+        [(SEQUENCE, 0), (SEQUENCE, 0), (SEQUENCE, 0)]
+    ]
+    # counts are restored after the search
+    assert counts == tile_counts(
+        [Tile(Suit.MANZU, v) for v in (1, 1, 1, 2, 2, 2, 3, 3, 3)]
+    )
+
+
+def test_sequences_do_not_wrap_across_suits():
+    counts = tile_counts(
+        [Tile(Suit.MANZU, 8), Tile(Suit.MANZU, 9), Tile(Suit.PINZU, 1)]
+    )
+    assert extract_melds(counts) == []
+
+
+def test_standard_decompositions_and_meld_tiles():
+    red = Tile(Suit.DRAGON, dragon=Dragon.RED)
+    tiles = [red] * 3 + [Tile(Suit.SOUZU, v) for v in (2, 3, 4, 7, 7)]
+    results = standard_decompositions(tile_counts(tiles))
+    assert len(results) == 1
+    melds, pair = results[0]
+    assert TILE_KINDS[pair] == Tile(Suit.SOUZU, 7)
+    assert sorted(meld_tiles(m)[0] == red for m in melds) == [False, True]
+    assert [Tile(Suit.SOUZU, v) for v in (2, 3, 4)] in [meld_tiles(m) for m in melds]
+
+
+def test_is_standard_hand_matches_decompositions():
+    # 1112345678999m is the nine-sided wait: 5m completes it, 1p does not
+    base = [Tile(Suit.MANZU, v) for v in (1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9)]
+    complete = tile_counts(base + [Tile(Suit.MANZU, 5)])
+    incomplete = tile_counts(base + [Tile(Suit.PINZU, 1)])
+    before = bytes(complete)
+
+    assert is_standard_hand(complete)
+    assert bytes(complete) == before  # search restores the counts
+    assert not is_standard_hand(incomplete)
+    assert not standard_decompositions(incomplete)
+
+
+def _random_counts(rng: random.Random, melds: int) -> bytearray:
+    """Counts of ``melds`` random melds plus a pair, or of 3n+2 random tiles."""
+    counts = bytearray(34)
+    if rng.random() < 0.5:
+        for _ in range(melds * 3 + 2):
+            counts[rng.choice([i for i in range(34) if counts[i] < 4])] += 1
+        return counts
+    for _ in range(melds):
+        if rng.random() < 0.4:
+            i = rng.randrange(34)
+            counts[i] += 3
+        else:
+            i = rng.randrange(27)
+            i -= max(0, i % 9 - 6)
+            for j in (i, i + 1, i + 2):
+                counts[j] += 1
+    counts[rng.randrange(34)] += 2
+    return counts if max(counts) <= 4 else _random_counts(rng, melds)
+
+
+def test_numba_kernels_match_python_search(monkeypatch):
+    pytest.importorskip("numba")
+    rng = random.Random(20240601)
+    hands = [_random_counts(rng, rng.randint(1, 4)) for _ in range(2000)]
+
+    def run(counts):
+        # Drop a pair (or two singles if there is none) to leave 3n tiles
+        pair_free = bytearray(counts)
+        top = max(range(34), key=pair_free.__getitem__)
+        if pair_free[top] >= 2:
+            pair_free[top] -= 2
+        else:
+            for i in [i for i in range(34) if pair_free[i]][:2]:
+                pair_free[i] -= 1
+        return (
+            sorted(extract_melds(bytearray(pair_free))),
+            sorted(extract_melds(bytearray(pair_free), allow_triplets=False)),
+            is_standard_hand(bytearray(counts)),
+        )
+
+    assert decomposition._numba.NUMBA_AVAILABLE
+    compiled = [run(counts) for counts in hands]
+    monkeypatch.setattr(decomposition._numba, "NUMBA_AVAILABLE", False)
+    python = [run(counts) for counts in hands]
+
+    assert compiled == python
+    assert any(complete for _, _, complete in python)
+    assert any(not complete for _, _, complete in python)
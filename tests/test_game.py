@@ -3,6 +3,8 @@
 Unit tests for Riichi Mahjong Engine
 """
 
+import pickle
+
 import pytest
 
 from src.game.engine import MahjongEngine
@@ -10,6 +12,18 @@ from src.game.hand import Hand, Meld
 from tiles.tile import Dragon, Suit, Tile, Wind
 
 
+@pytest.fixture(scope="module")
+def engine_snapshot():
+    """A freshly dealt game, pickled once for the whole module"""
+    return pickle.dumps(MahjongEngine(["Alice", "Bob", "Charlie", "David"]))
+
+
+@pytest.fixture
+def fresh_engine(engine_snapshot):
+    """An independent copy of the dealt game for each test"""
+    return pickle.loads(engine_snapshot)
+
+
 class TestMahjongEngine:
     def test_game_initialization(self):
         """Test game initializes correctly"""
@@ -143,10 +157,9 @@ class TestMahjongEngine:
         south_dora = east_indicator.next_tile()
         assert south_dora.wind == Wind.SOUTH
 
-    def test_player_actions(self):
+    def test_player_actions(self, fresh_engine):
         """Test basic player actions"""
-        players = ["Alice", "Bob", "Charlie", "David"]
-        game = MahjongEngine(players)
+        game = fresh_engine
 
         # Test discard
         player = game.players[0]
@@ -159,10 +172,9 @@ class TestMahjongEngine:
             assert len(player.hand.concealed_tiles) == initial_hand_size - 1
             assert len(player.hand.discards) == 1
 
-    def test_riichi_declaration(self):
+    def test_riichi_declaration(self, fresh_engine):
         """Test riichi declaration"""
-        players = ["Alice", "Bob", "Charlie", "David"]
-        game = MahjongEngine(players)
+        game = fresh_engine
 
         player = game.players[0]
         initial_score = player.score
@@ -330,10 +342,9 @@ class TestMahjongEngine:
 
         assert YakuChecker._check_kokushi(hand, winning_tile)
 
-    def test_riichi_prevents_added_kan(self):
+    def test_riichi_prevents_added_kan(self, fresh_engine):
         """Test riichi blocks added kan from an open pon"""
-        players = ["Alice", "Bob", "Charlie", "David"]
-        game = MahjongEngine(players)
+        game = fresh_engine
 
         player = game.players[0]
         player.hand.is_riichi = True
@@ -376,10 +387,9 @@ class TestMahjongEngine:
         dora_tiles = wall.get_dora_tiles()
         assert len(dora_tiles) >= 1
 
-    def test_closed_kan_action(self):
+    def test_closed_kan_action(self, fresh_engine):
         """Test closed kan declaration"""
-        players = ["Alice", "Bob", "Charlie", "David"]
-        game = MahjongEngine(players)
+        game = fresh_engine
 
         player = game.players[0]
         game.current_player = 0
@@ -410,10 +420,9 @@ class TestMahjongEngine:
         assert result["success"]
         assert any(meld.is_kan() for meld in player.hand.melds)
 
-    def test_upgrade_pon_to_kan(self):
+    def test_upgrade_pon_to_kan(self, fresh_engine):
         """Test upgrading an open pon to a kan"""
-        players = ["Alice", "Bob", "Charlie", "David"]
-        game = MahjongEngine(players)
+        game = fresh_engine
 
         player = game.players[0]
         game.current_player = 0
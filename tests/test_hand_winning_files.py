@@ -29,3 +29,9 @@ def test_waiting_on_four_sou():
     assert four_sou in waits
     # should be *exactly* one winning tile in this pattern
     assert len(waits) == 1
+
+
+def test_is_winning_tile_matches_waits():
+    hand = build_hand()
+    assert hand.is_winning_tile(Tile(Suit.SOUZU, 4))
+    assert not hand.is_winning_tile(Tile(Suit.SOUZU, 5))
@@ -2,7 +2,7 @@ import pytest
 
 from src.game.hand import Hand, Meld
 from src.game.rules import YakuChecker
-from tiles.tile import Suit, Tile, Wind
+from tiles.tile import Dragon, Suit, Tile, Wind
 
 
 def _seq(suit: Suit, start: int):
@@ -42,3 +42,115 @@ def test_pinfu_tanyao_detection():
     assert "menzen tsumo" in names
     # no honor tiles, so yakuhai must **not** appear
     assert "yakuhai" not in names
+
+
+def test_check_all_yaku_cached_result_is_independent():
+    hand, winning = build_closed_pinfu_tanyao_hand()
+    kwargs = dict(
+        winning_tile=winning,
+        is_tsumo=True,
+        seat_wind=Wind.EAST,
+        round_wind=Wind.EAST,
+        dora_tiles=[],
+    )
+    first = YakuChecker.check_all_yaku(hand, **kwargs)
+    first.clear()
+    second = YakuChecker.check_all_yaku(hand, **kwargs)
+    assert {y.name for y in second} >= {"Tanyao", "Pinfu", "Menzen Tsumo"}
+
+    hand.is_riichi = True
+    riichi = YakuChecker.check_all_yaku(hand, **kwargs)
+    assert "Riichi" in {y.name for y in riichi}
+
+
+def test_multiple_yakuhai_triplets_are_a_single_entry():
+    red = Tile(Suit.DRAGON, dragon=Dragon.RED)
+    white = Tile(Suit.DRAGON, dragon=Dragon.WHITE)
+    hand = Hand()
+    hand.concealed_tiles = (
+        [red, red, red, white, white, white]
+        + _seq(Suit.MANZU, 2)
+        + _seq(Suit.PINZU, 3)
+        + [Tile(Suit.PINZU, 9)]
+    )
+    yaku = YakuChecker.check_all_yaku(
+        hand,
+        winning_tile=Tile(Suit.PINZU, 9),
+        is_tsumo=False,
+        seat_wind=Wind.SOUTH,
+        round_wind=Wind.EAST,
+        dora_tiles=[],
+    )
+    yakuhai = [y for y in yaku if y.name == "Yakuhai"]
+    assert len(yakuhai) == 1
+    assert yakuhai[0].han == 2
+
+
+def test_cached_yaku_still_counts_current_dora():
+    hand, winning = build_closed_pinfu_tanyao_hand()
+    kwargs = dict(
+        winning_tile=winning,
+        is_tsumo=True,
+        seat_wind=Wind.EAST,
+        round_wind=Wind.EAST,
+    )
+    without = YakuChecker.check_all_yaku(hand, dora_tiles=[], **kwargs)
+    with_dora = YakuChecker.check_all_yaku(
+        hand, dora_tiles=[Tile(Suit.PINZU, 2)], **kwargs
+    )
+    assert "Dora" not in {y.name for y in without}
+    assert {y.name: y.han for y in with_dora}["Dora"] == 2
+
+
+def test_red_five_counts_once_with_ura_dora():
+    hand, winning = build_closed_pinfu_tanyao_hand()
+    hand.concealed_tiles = [
+        Tile(Suit.MANZU, 5, is_red=True) if t == Tile(Suit.MANZU, 5) else t
+        for t in hand.concealed_tiles
+    ]
+    hand.is_riichi = True
+    yaku = YakuChecker.check_all_yaku(
+        hand,
+        winning_tile=winning,
+        is_tsumo=True,
+        seat_wind=Wind.EAST,
+        round_wind=Wind.EAST,
+        dora_tiles=[],
+        ura_dora_tiles=[Tile(Suit.WIND, wind=Wind.NORTH)],
+    )
+    assert {y.name: y.han for y in yaku}["Dora"] == 1
+
+
+def test_repeated_dora_indicator_counts_each_time():
+    hand, winning = build_closed_pinfu_tanyao_hand()
+    yaku = YakuChecker.check_all_yaku(
+        hand,
+        winning_tile=winning,
+        is_tsumo=True,
+        seat_wind=Wind.EAST,
+        round_wind=Wind.EAST,
+        dora_tiles=[Tile(Suit.PINZU, 2), Tile(Suit.PINZU, 2)],
+    )
+    assert {y.name: y.han for y in yaku}["Dora"] == 4
+
+
+def test_junchan_replaces_chanta():
+    hand = Hand()
+    hand.concealed_tiles = (
+        _seq(Suit.MANZU, 1)
+        + _seq(Suit.MANZU, 7)
+        + _seq(Suit.PINZU, 1)
+        + _seq(Suit.SOUZU, 7)
+        + [Tile(Suit.SOUZU, 1)]
+    )
+    yaku = YakuChecker.check_all_yaku(
+        hand,
+        winning_tile=Tile(Suit.SOUZU, 1),
+        is_tsumo=False,
+        seat_wind=Wind.EAST,
+        round_wind=Wind.EAST,
+        dora_tiles=[],
+    )
+    names = {y.name for y in yaku}
+    assert "Junchan" in names
+    assert "Chanta" not in names
@@ -96,6 +96,36 @@ class TestTile:
         white = Tile(Suit.DRAGON, dragon=Dragon.WHITE)
         assert white.next_tile() == Tile(Suit.DRAGON, dragon=Dragon.GREEN)
 
+    def test_tile_index(self):
+        """Test every tile kind maps to a distinct index in 0-33"""
+        tiles = [
+            Tile(suit, value=value)
+            for suit in (Suit.MANZU, Suit.PINZU, Suit.SOUZU)
+            for value in range(1, 10)
+        ]
+        tiles += [Tile(Suit.WIND, wind=wind) for wind in Wind]
+        tiles += [Tile(Suit.DRAGON, dragon=dragon) for dragon in Dragon]
+        assert sorted(tile.index for tile in tiles) == list(range(34))
+        assert Tile(Suit.PINZU, value=5, is_red=True).index == 13
+
+    def test_tiles_are_interned_and_immutable(self):
+        """Test identical tiles share one instance and cannot be mutated"""
+        import copy
+        import pickle
+
+        tile = Tile(Suit.SOUZU, value=3)
+        assert Tile(Suit.SOUZU, 3) is tile
+        assert copy.deepcopy(tile) is tile
+        assert pickle.loads(pickle.dumps(tile)) is tile
+
+        red = Tile(Suit.SOUZU, value=5, is_red=True)
+        plain = Tile(Suit.SOUZU, value=5)
+        assert red is not plain
+        assert red == plain and hash(red) == hash(plain)
+
+        with pytest.raises(AttributeError):
+            tile.value = 4
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,154 @@
+"""
+Flask test-client coverage for the web server's game store and Socket.IO
+updates. Runs on the threading backend so eventlet is not required.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("flask_socketio")
+pytest.importorskip("orjson")
+
+from src import web_server  # noqa: E402
+from src.web_server import GameStore, create_app  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    return create_app(async_mode="threading")
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _create_game(client) -> str:
+    response = client.post("/api/create_game", json={})
+    assert response.status_code == 200
+    return response.get_json()["game_id"]
+
+
+def _first_tile(client, game_id: str) -> str:
+    hand = client.get(f"/api/game/{game_id}/player/0/hand").get_json()
+    return hand["concealed_tiles"][0]
+
+
+def _discard(client, game_id: str, tile: str):
+    return client.post(
+        f"/api/game/{game_id}/action",
+        json={"player_index": 0, "action": "discard", "kwargs": {"tile": tile}},
+    )
+
+
+def test_apps_have_isolated_stores_and_sockets():
+    first = create_app(async_mode="threading")
+    second = create_app(async_mode="threading")
+
+    assert first.extensions["game_store"] is not second.extensions["game_store"]
+    assert first.extensions["socketio"] is not second.extensions["socketio"]
+
+    game_id = _create_game(first.test_client())
+    assert second.test_client().get(f"/api/game/{game_id}/state").status_code == 404
+
+
+def test_store_evicts_least_recently_used_game():
+    expired = []
+    store = GameStore(max_games=2, on_expire=expired.append)
+    store.add("a", object())
+    store.add("b", object())
+    assert store.get("a") is not None  # "b" is now the least recently used
+
+    store.add("c", object())
+
+    assert list(store.games) == ["a", "c"]
+    assert expired == ["b"]
+
+
+def test_store_expires_idle_games(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(web_server.time, "monotonic", lambda: now[0])
+    store = GameStore(ttl_seconds=60)
+    store.add("old", object())
+    store.player_sessions["sid"] = "old"
+    store.queue_update("old", {"state": {}})
+
+    now[0] += 61
+
+    assert store.get("old") is None
+    assert not store.player_sessions
+    assert not store.pending_updates
+
+
+def test_seat_out_of_range_is_not_found(client):
+    game_id = _create_game(client)
+
+    assert client.get(f"/api/game/{game_id}/player/3/hand").status_code == 200
+    assert client.get(f"/api/game/{game_id}/player/4/hand").status_code == 404
+    assert client.get(f"/api/game/{game_id}/player/4/actions").status_code == 404
+
+
+def test_action_invalidates_cached_state_and_actions(app, client, monkeypatch):
+    game_id = _create_game(client)
+    game = app.extensions["game_store"].games[game_id]
+    calls = {"state": 0, "actions": 0}
+    get_game_state = game.get_game_state
+    get_valid_actions = game.get_valid_actions
+
+    def counted_state():
+        calls["state"] += 1
+        return get_game_state()
+
+    def counted_actions(player_index):
+        calls["actions"] += 1
+        return get_valid_actions(player_index)
+
+    monkeypatch.setattr(game, "get_game_state", counted_state)
+    monkeypatch.setattr(game, "get_valid_actions", counted_actions)
+
+    before = client.get(f"/api/game/{game_id}/state").get_json()
+    client.get(f"/api/game/{game_id}/state")
+    client.get(f"/api/game/{game_id}/player/0/actions")
+    client.get(f"/api/game/{game_id}/player/0/actions")
+    assert calls == {"state": 0, "actions": 1}  # state cached at creation
+
+    assert _discard(client, game_id, _first_tile(client, game_id)).status_code == 200
+    after = client.get(f"/api/game/{game_id}/state").get_json()
+    client.get(f"/api/game/{game_id}/player/0/actions")
+
+    assert calls == {"state": 1, "actions": 2}
+    assert after != before
+
+
+def test_updates_are_coalesced_per_room(app, client, monkeypatch):
+    monkeypatch.setattr(web_server, "UPDATE_INTERVAL_SECONDS", 0.2)
+    game_id = _create_game(client)
+    socket = app.extensions["socketio"].test_client(app, flask_test_client=client)
+    socket.emit("join_game", {"game_id": game_id, "player_index": 0})
+    assert [m["name"] for m in socket.get_received()] == ["joined_game"]
+
+    tile = _first_tile(client, game_id)
+    _discard(client, game_id, tile)
+    last = _discard(client, game_id, tile).get_json()
+    time.sleep(0.5)
+
+    updates = [m for m in socket.get_received() if m["name"] == "game_update"]
+    assert len(updates) == 1
+    assert updates[0]["args"][0]["result"] == last
+    socket.disconnect()
+
+
+def test_expired_game_notifies_its_room(app, client):
+    game_id = _create_game(client)
+    socket = app.extensions["socketio"].test_client(app, flask_test_client=client)
+    socket.emit("join_game", {"game_id": game_id, "player_index": 0})
+    socket.get_received()
+
+    app.extensions["game_store"].ttl_seconds = 0
+    assert client.get(f"/api/game/{game_id}/state").status_code == 404
+
+    expired = [m for m in socket.get_received() if m["name"] == "game_expired"]
+    assert expired and expired[0]["args"][0] == {"game_id": game_id}
+    assert not app.extensions["game_store"].player_sessions
+    socket.disconnect()
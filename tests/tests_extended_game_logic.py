@@ -9,6 +9,7 @@ state manipulation.
 
 from __future__ import annotations
 
+import pickle
 import types
 
 import pytest
@@ -22,30 +23,43 @@ from tiles.tile import Suit, Tile, Wind
 # ────────────────────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture(autouse=True)
-def stub_scoring(monkeypatch):
+@pytest.fixture(scope="module", autouse=True)
+def stub_scoring():
     """Stub out YakuChecker and Scoring to deterministic values."""
     dummy_yaku = types.SimpleNamespace(name="Dummy", han=1)
-    monkeypatch.setattr(
-        "src.game.rules.YakuChecker.check_all_yaku",
-        lambda *a, **kw: [dummy_yaku],
-        raising=False,
-    )
-    monkeypatch.setattr(
-        "src.game.scoring.Scoring.calculate_score",
-        lambda *args, **kwargs: (
-            1000,
-            {"all": 333, "dealer": 500, "non_dealer": 250, "discarder": 1000},
-        ),
-        raising=False,
-    )
-    yield  # tests run here
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.game.rules.YakuChecker.check_all_yaku",
+            lambda *a, **kw: [dummy_yaku],
+            raising=False,
+        )
+        mp.setattr(
+            "src.game.scoring.Scoring.calculate_score",
+            lambda *args, **kwargs: (
+                1000,
+                {"all": 333, "dealer": 500, "non_dealer": 250, "discarder": 1000},
+            ),
+            raising=False,
+        )
+        yield  # tests run here
 
 
 def _fresh_engine() -> MahjongEngine:
     return MahjongEngine(["A", "B", "C", "D"], use_red_fives=False)
 
 
+@pytest.fixture(scope="module")
+def engine_snapshot():
+    """One dealt engine, pickled once for the whole module."""
+    return pickle.dumps(_fresh_engine())
+
+
+@pytest.fixture
+def eng(engine_snapshot):
+    """An independent copy of the dealt engine for each test."""
+    return pickle.loads(engine_snapshot)
+
+
 def _make_four_of(tile: Tile) -> list[Tile]:
     return [tile, tile, tile, tile]
 
@@ -70,8 +84,7 @@ def test_init_sets_up_players_and_phase():
 # get_game_state
 
 
-def test_get_game_state_contains_expected_keys():
-    eng = _fresh_engine()
+def test_get_game_state_contains_expected_keys(eng):
     state = eng.get_game_state()
     for key in ["phase", "current_player", "dealer", "players", "wall_tiles_remaining"]:
         assert key in state
@@ -82,8 +95,7 @@ def test_get_game_state_contains_expected_keys():
 # get_player_hand
 
 
-def test_get_player_hand_reports_tenpai_and_riichi():
-    eng = _fresh_engine()
+def test_get_player_hand_reports_tenpai_and_riichi(eng):
     hand_data = eng.get_player_hand(0)
     # should always have concealed_tiles key etc.
     assert {
@@ -98,8 +110,7 @@ def test_get_player_hand_reports_tenpai_and_riichi():
 # _can_declare_riichi
 
 
-def test_can_declare_riichi_logic(monkeypatch):
-    eng = _fresh_engine()
+def test_can_declare_riichi_logic(eng, monkeypatch):
     p = eng.players[0]
     monkeypatch.setattr(p.hand, "is_closed", lambda: True)
     monkeypatch.setattr(p, "is_tenpai", lambda: True)
@@ -112,8 +123,7 @@ def test_can_declare_riichi_logic(monkeypatch):
 # get_valid_actions
 
 
-def test_get_valid_actions_for_current_player(monkeypatch):
-    eng = _fresh_engine()
+def test_get_valid_actions_for_current_player(eng, monkeypatch):
     current = eng.current_player
     player = eng.players[current]
     # Ensure hand size 14 so discard is available
@@ -126,8 +136,7 @@ def test_get_valid_actions_for_current_player(monkeypatch):
 # _execute_discard & execute_action dispatcher
 
 
-def test_execute_discard_flow():
-    eng = _fresh_engine()
+def test_execute_discard_flow(eng):
     p = eng.players[0]
     tile_to_disc = p.hand.concealed_tiles[0]
     res = eng.execute_action(0, "discard", tile=str(tile_to_disc))
@@ -138,8 +147,7 @@ def test_execute_discard_flow():
 # advance_turn
 
 
-def test_advance_turn_draws_tile_and_rotates():
-    eng = _fresh_engine()
+def test_advance_turn_draws_tile_and_rotates(eng):
     eng.last_discard = None  # so advance_turn will rotate
     first_player = eng.current_player
     eng.advance_turn()
@@ -151,8 +159,7 @@ def test_advance_turn_draws_tile_and_rotates():
 # start_new_round
 
 
-def test_start_new_round_resets_state():
-    eng = _fresh_engine()
+def test_start_new_round_resets_state(eng):
     eng.start_new_round()
     assert eng.phase == GamePhase.PLAYING  # dealing done automatically
     assert eng.turn_number == 0
@@ -161,8 +168,7 @@ def test_start_new_round_resets_state():
 # advance_round
 
 
-def test_advance_round_wind_rotation():
-    eng = _fresh_engine()
+def test_advance_round_wind_rotation(eng):
     ended = eng.advance_round()
     # After first call dealer moves to 1, round wind stays EAST
     assert not ended
@@ -176,8 +182,7 @@ def test_advance_round_wind_rotation():
 # _handle_draw & is_game_over
 
 
-def test_handle_draw_payments_and_phase(monkeypatch):
-    eng = _fresh_engine()
+def test_handle_draw_payments_and_phase(eng, monkeypatch):
     # Stub wall to appear empty so _handle_draw is called
     monkeypatch.setattr(eng.wall, "tiles_remaining", lambda: 0)
     result = eng.execute_action(0, "pass")
@@ -188,8 +193,7 @@ def test_handle_draw_payments_and_phase(monkeypatch):
 # _apply_tsumo_payments (indirect via _execute_tsumo)
 
 
-def test_execute_tsumo_updates_scores(monkeypatch):
-    eng = _fresh_engine()
+def test_execute_tsumo_updates_scores(eng, monkeypatch):
     p = eng.players[0]
 
     # Force p into tsumo‑able state: hand size 14 & can_tsumo returns True
@@ -202,8 +206,7 @@ def test_execute_tsumo_updates_scores(monkeypatch):
 # _execute_ron
 
 
-def test_execute_ron_success(monkeypatch):
-    eng = _fresh_engine()
+def test_execute_ron_success(eng, monkeypatch):
     discarder = eng.players[0]
     caller = eng.players[1]
     winning_tile = discarder.hand.concealed_tiles[0]
@@ -221,8 +224,7 @@ def test_execute_ron_success(monkeypatch):
 # _execute_chii
 
 
-def test_execute_chii_valid(monkeypatch):
-    eng = _fresh_engine()
+def test_execute_chii_valid(eng, monkeypatch):
     # Prepare tiles 2‑3‑4 sou with player 1 able to chii 3‑sou from player 0
     two = Tile(Suit.SOUZU, 2)
     four = Tile(Suit.SOUZU, 4)
@@ -241,8 +243,7 @@ def test_execute_chii_valid(monkeypatch):
 # _execute_pon
 
 
-def test_execute_pon(monkeypatch):
-    eng = _fresh_engine()
+def test_execute_pon(eng, monkeypatch):
     t = Tile(Suit.PINZU, 5)
     eng.last_discard = t
     eng.last_discard_player = 0
@@ -259,8 +260,7 @@ def test_execute_pon(monkeypatch):
 # _execute_kan (open from discard)
 
 
-def test_execute_open_kan(monkeypatch):
-    eng = _fresh_engine()
+def test_execute_open_kan(eng, monkeypatch):
     t = Tile(Suit.MANZU, 9)
     eng.last_discard = t
     eng.last_discard_player = 0
@@ -276,8 +276,7 @@ def test_execute_open_kan(monkeypatch):
 # can_call_closed_kan & execute_closed_kan
 
 
-def test_closed_kan_flow(monkeypatch):
-    eng = _fresh_engine()
+def test_closed_kan_flow(eng, monkeypatch):
     eng.current_player = 0
     t = Tile(Suit.PINZU, 1)
     p = eng.players[0]
@@ -294,8 +293,7 @@ def test_closed_kan_flow(monkeypatch):
 # can_upgrade_pon_to_kan
 
 
-def test_can_upgrade_pon_to_kan():
-    eng = _fresh_engine()
+def test_can_upgrade_pon_to_kan(eng):
     p = eng.players[0]
     t = Tile(Suit.SOUZU, 7)
     # create open pon meld
@@ -310,9 +308,7 @@ def test_can_upgrade_pon_to_kan():
 # get_safe_tiles_for_player & get_dangerous_tiles_for_player
 
 
-def test_safe_and_dangerous_tiles_logic(monkeypatch):
-    eng = _fresh_engine()
-
+def test_safe_and_dangerous_tiles_logic(eng, monkeypatch):
     safe_tile = Tile(Suit.MANZU, 1)
     danger_tile = Tile(Suit.MANZU, 9)
 
@@ -330,8 +326,7 @@ def test_safe_and_dangerous_tiles_logic(monkeypatch):
 # get_game_log
 
 
-def test_game_log_returns_state_snapshot():
-    eng = _fresh_engine()
+def test_game_log_returns_state_snapshot(eng):
     log = eng.get_game_log()
     assert isinstance(log, list) and log[0]["action"] == "game_state"
 
@@ -339,8 +334,7 @@ def test_game_log_returns_state_snapshot():
 # reset_game
 
 
-def test_reset_game_restores_initial_conditions():
-    eng = _fresh_engine()
+def test_reset_game_restores_initial_conditions(eng):
     eng.players[0].score = 100
     eng.turn_number = 5
     eng.reset_game()